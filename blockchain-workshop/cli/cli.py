@@ -1,25 +1,37 @@
+import asyncio
+import shutil
+import sys
 import click
 import requests
 import json
+import orjson
+import aiohttp
+from datetime import datetime
+from requests.adapters import HTTPAdapter
 from typing import Optional
 
 SERVER_URL = 'http://131.226.220.69:5000'
 
 class AliasedGroup(click.Group):
     def format_commands(self, ctx, formatter):
-        # Group commands by callback
-        rows = []
-        seen = set()
+        # Group commands by callback in a single pass, keyed by identity
+        # (never callback __eq__, which can dispatch into Python-level
+        # comparison on decorated functions)
+        groups = {}
+        order = []
         for cmd_name, cmd in self.commands.items():
             if cmd.callback is None:
                 continue
-            # Find all names for this callback (short and long)
-            if id(cmd.callback) in seen:
-                continue
-            aliases = [name for name, c in self.commands.items() if c.callback == cmd.callback]
-            seen.add(id(cmd.callback))
-            # Show all aliases comma-separated, description from the first
-            rows.append((", ".join(aliases), cmd.get_short_help_str()))
+            key = id(cmd.callback)
+            if key not in groups:
+                groups[key] = []
+                order.append(key)
+            groups[key].append(cmd_name)
+        # Show all aliases comma-separated, description from the first
+        rows = [
+            (", ".join(groups[key]), self.commands[groups[key][0]].get_short_help_str())
+            for key in order
+        ]
         if rows:
             with formatter.section('Commands'):
                 formatter.write_dl(rows)
@@ -38,12 +50,18 @@ class AliasedGroup(click.Group):
 class BlockchainCLI:
     def __init__(self, server_url=SERVER_URL):
         self.server_url = server_url
+        # Reuse one session for all requests so TCP/TLS setup is paid once
+        # per CLI invocation instead of once per command.
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8)
+        self._session.mount('http://', adapter)
+        self._session.mount('https://', adapter)
 
     def add_transaction(self, source: str, recipient: str, amount: float) -> bool:
         """Add a new transaction to the blockchain"""
         try:
             print(f"Attempting transaction: {source} -> {recipient} for ${amount:.2f}")
-            response = requests.post(
+            response = self._session.post(
                 f"{self.server_url}/transactions/new",
                 json={
                     'source': source,
@@ -63,20 +81,12 @@ class BlockchainCLI:
                     
                     if 'reason' in error_data:
                         error_msg += f"\n   Reason: {error_data['reason']}"
-                        
-                        # Add helpful hints based on error type
-                        if "user 'alice' does not exist" in error_data['reason']:
-                            error_msg += f"\n   Hint: Create user 'alice' with 'create-user alice'"
-                        elif "user 'Charlie' does not exist" in error_data['reason']:
-                            error_msg += f"\n   Hint: Create user 'Charlie' with 'create-user Charlie'"
-                        elif "does not exist" in error_data['reason']:
-                            # Extract username from error message
-                            import re
-                            match = re.search(r"'([^']+)' does not exist", error_data['reason'])
-                            if match:
-                                username = match.group(1)
-                                error_msg += f"\n   Hint: Create user '{username}' with 'create-user {username}'"
-                    
+
+                        # The server reports the missing username directly
+                        missing = error_data.get('missing_user')
+                        if missing:
+                            error_msg += f"\n   Hint: Create user '{missing}' with 'create-user {missing}'"
+
                     print(error_msg)
                 except ValueError:
                     # Fallback for non-JSON responses
@@ -94,7 +104,7 @@ class BlockchainCLI:
     def print_chain(self) -> Optional[dict]:
         """Print the entire blockchain"""
         try:
-            response = requests.get(f"{self.server_url}/chain")
+            response = self._session.get(f"{self.server_url}/chain")
             if response.status_code == 200:
                 return response.json()
             return None
@@ -102,10 +112,26 @@ class BlockchainCLI:
             print("Error: Could not connect to the server. Make sure it's running.")
             return None
 
+    def stream_chain(self, fileobj) -> bool:
+        """Stream the raw /chain response bytes into fileobj
+
+        Avoids parsing the whole chain into memory and re-serializing it
+        when the caller just wants the JSON on disk or stdout.
+        """
+        try:
+            response = self._session.get(f"{self.server_url}/chain", stream=True)
+            if response.status_code == 200:
+                shutil.copyfileobj(response.raw, fileobj)
+                return True
+            return False
+        except requests.exceptions.ConnectionError:
+            print("Error: Could not connect to the server. Make sure it's running.")
+            return False
+
     def print_block(self, index: int) -> Optional[dict]:
         """Print a specific block"""
         try:
-            response = requests.get(f"{self.server_url}/block/{index}")
+            response = self._session.get(f"{self.server_url}/block/{index}")
             if response.status_code == 200:
                 return response.json()
             print(f"Error: {response.json().get('message', 'Unknown error')}")
@@ -117,7 +143,7 @@ class BlockchainCLI:
     def print_balances(self) -> Optional[dict]:
         """Print all balances"""
         try:
-            response = requests.get(f"{self.server_url}/balances")
+            response = self._session.get(f"{self.server_url}/balances")
             if response.status_code == 200:
                 return response.json()
             return None
@@ -125,10 +151,22 @@ class BlockchainCLI:
             print("Error: Could not connect to the server. Make sure it's running.")
             return None
 
+    def print_balance(self, username: str) -> Optional[dict]:
+        """Print the balance for a single user"""
+        try:
+            response = self._session.get(f"{self.server_url}/balances/{username}")
+            if response.status_code == 200:
+                return response.json()
+            print(f"Error: {response.json().get('error', 'Unknown error')}")
+            return None
+        except requests.exceptions.ConnectionError:
+            print("Error: Could not connect to the server. Make sure it's running.")
+            return None
+
     def print_invalid_transactions(self) -> Optional[dict]:
         """Get all invalid transactions with their error messages"""
         try:
-            response = requests.get(f"{self.server_url}/invalid")
+            response = self._session.get(f"{self.server_url}/invalid")
             if response.status_code == 200:
                 return response.json()
             print(f"Error: {response.text}")
@@ -140,7 +178,7 @@ class BlockchainCLI:
     def reset_blockchain(self) -> bool:
         """Reset the blockchain to its initial state"""
         try:
-            response = requests.post(f"{self.server_url}/reset")
+            response = self._session.post(f"{self.server_url}/reset")
             return response.status_code == 200
         except requests.exceptions.ConnectionError:
             print("Error: Could not connect to the server. Make sure it's running.")
@@ -150,7 +188,7 @@ class BlockchainCLI:
         """Export complete blockchain data to a JSON file"""
         try:
             print(f"Exporting blockchain data to {filepath}...")
-            response = requests.post(
+            response = self._session.post(
                 f"{self.server_url}/export",
                 json={'filepath': filepath}
             )
@@ -178,7 +216,7 @@ class BlockchainCLI:
     def create_user(self, username: str) -> bool:
         """Create a new user with a starting balance"""
         try:
-            response = requests.post(
+            response = self._session.post(
                 f"{self.server_url}/users/create",
                 json={'username': username}
             )
@@ -192,6 +230,106 @@ class BlockchainCLI:
             print("Error: Could not connect to the server. Make sure it's running.")
             return False
 
+class AsyncBlockchainCLI:
+    """Async sibling of BlockchainCLI for issuing independent calls concurrently.
+
+    Commands that fire many independent requests (e.g. bulk transaction
+    seeding) can gather them on one aiohttp session so N requests cost
+    roughly one round-trip of wall-clock time instead of N.
+    """
+
+    def __init__(self, server_url=SERVER_URL):
+        self.server_url = server_url
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    async def __aenter__(self):
+        self._session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=16, keepalive_timeout=30)
+        )
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self._session.close()
+
+    async def add_transaction(self, source: str, recipient: str, amount: float) -> bool:
+        """Add a new transaction to the blockchain"""
+        try:
+            async with self._session.post(
+                f"{self.server_url}/transactions/new",
+                json={'source': source, 'recipient': recipient, 'amount': amount}
+            ) as response:
+                if response.status == 201:
+                    return True
+                try:
+                    error_data = await response.json()
+                    print(f"✗ FAILED: {source} -> {recipient} ${amount:.2f}: "
+                          f"{error_data.get('reason', error_data.get('error', 'Unknown error'))}")
+                except (ValueError, aiohttp.ContentTypeError):
+                    print(f"✗ FAILED: {source} -> {recipient} ${amount:.2f}: {await response.text()}")
+                return False
+        except aiohttp.ClientConnectionError:
+            print("✗ ERROR: Could not connect to the server. Make sure it's running.")
+            return False
+
+    async def create_user(self, username: str) -> bool:
+        """Create a new user with a starting balance"""
+        try:
+            async with self._session.post(
+                f"{self.server_url}/users/create",
+                json={'username': username}
+            ) as response:
+                return response.status == 201
+        except aiohttp.ClientConnectionError:
+            print("Error: Could not connect to the server. Make sure it's running.")
+            return False
+
+    async def _get_json(self, path: str) -> Optional[dict]:
+        try:
+            async with self._session.get(f"{self.server_url}{path}") as response:
+                if response.status == 200:
+                    return await response.json()
+                return None
+        except aiohttp.ClientConnectionError:
+            print("Error: Could not connect to the server. Make sure it's running.")
+            return None
+
+    async def print_chain(self) -> Optional[dict]:
+        """Fetch the entire blockchain"""
+        return await self._get_json("/chain")
+
+    async def print_block(self, index: int) -> Optional[dict]:
+        """Fetch a specific block"""
+        return await self._get_json(f"/block/{index}")
+
+    async def print_balances(self) -> Optional[dict]:
+        """Fetch all balances"""
+        return await self._get_json("/balances")
+
+    async def print_invalid_transactions(self) -> Optional[dict]:
+        """Fetch all invalid transactions with their error messages"""
+        return await self._get_json("/invalid")
+
+    async def reset_blockchain(self) -> bool:
+        """Reset the blockchain to its initial state"""
+        try:
+            async with self._session.post(f"{self.server_url}/reset") as response:
+                return response.status == 200
+        except aiohttp.ClientConnectionError:
+            print("Error: Could not connect to the server. Make sure it's running.")
+            return False
+
+    async def export_blockchain(self, filepath: str) -> bool:
+        """Export complete blockchain data to a JSON file"""
+        try:
+            async with self._session.post(
+                f"{self.server_url}/export",
+                json={'filepath': filepath}
+            ) as response:
+                return response.status == 200
+        except aiohttp.ClientConnectionError:
+            print("✗ ERROR: Could not connect to the server. Make sure it's running.")
+            return False
+
 @click.group(cls=AliasedGroup)
 @click.option('--server', default=SERVER_URL, help='Server URL')
 @click.pass_context
@@ -215,12 +353,19 @@ def add_transaction(ctx, source, recipient, amount):
 cli.add_command(add_transaction, 'at')
 
 @cli.command('show-chain')
+@click.option('--raw', is_flag=True, help='Stream the raw JSON bytes without pretty-printing')
 @click.pass_context
-def show_chain(ctx):
+def show_chain(ctx, raw):
     """Show the entire blockchain"""
+    if raw:
+        # Pipe the response straight to stdout: O(1) memory for long chains
+        if ctx.obj['cli'].stream_chain(sys.stdout.buffer):
+            sys.stdout.buffer.write(b'\n')
+        return
+
     chain = ctx.obj['cli'].print_chain()
     if chain:
-        print(json.dumps(chain, indent=2))
+        print(orjson.dumps(chain, option=orjson.OPT_INDENT_2).decode())
 
 cli.add_command(show_chain, 'sc')
 
@@ -231,14 +376,21 @@ def show_block(ctx, index):
     """Show a specific block"""
     block = ctx.obj['cli'].print_block(index)
     if block:
-        print(json.dumps(block, indent=2))
+        print(orjson.dumps(block, option=orjson.OPT_INDENT_2).decode())
 
 cli.add_command(show_block, 'sb')
 
 @cli.command('show-balances')
+@click.option('--user', default=None, help='Show only this user\'s balance')
 @click.pass_context
-def show_balances(ctx):
+def show_balances(ctx, user):
     """Show all account balances"""
+    if user:
+        result = ctx.obj['cli'].print_balance(user)
+        if result:
+            print(f"{result['username']}: ${result['balance']:.2f}")
+        return
+
     balances = ctx.obj['cli'].print_balances()
     if balances:
         print("\n" + "=" * 40)
@@ -280,23 +432,28 @@ def show_invalid(ctx):
         print("No invalid transactions found")
         return
         
-    print("\n" + "=" * 60)
-    print(f"🚫 INVALID TRANSACTIONS: {len(invalid['invalid_transactions'])}")
-    print("=" * 60)
-    
+    # Accumulate the report and emit it with one write: a single stdout
+    # lock/syscall instead of half a dozen per transaction.
+    lines = [
+        "\n" + "=" * 60,
+        f"🚫 INVALID TRANSACTIONS: {len(invalid['invalid_transactions'])}",
+        "=" * 60,
+    ]
+
     for i, tx in enumerate(invalid['invalid_transactions'], 1):
-        print(f"\n{i}. Transaction Details:")
-        print(f"   Source:      {tx['source']}")
-        print(f"   Recipient:   {tx['recipient']}")
-        print(f"   Amount:      ${float(tx['amount']):.2f}")
+        lines.append(f"\n{i}. Transaction Details:")
+        lines.append(f"   Source:      {tx['source']}")
+        lines.append(f"   Recipient:   {tx['recipient']}")
+        lines.append(f"   Amount:      ${float(tx['amount']):.2f}")
         if 'timestamp' in tx:
-            from datetime import datetime
             timestamp = datetime.fromtimestamp(tx['timestamp']).strftime('%Y-%m-%d %H:%M:%S')
-            print(f"   Timestamp:   {timestamp}")
-        print(f"   Error:       {tx.get('validation_error', 'Unknown error')}")
-        print(f"   " + "-" * 56)
-    
-    print("\n" + "=" * 60)
+            lines.append(f"   Timestamp:   {timestamp}")
+        lines.append(f"   Error:       {tx.get('validation_error', 'Unknown error')}")
+        lines.append("   " + "-" * 56)
+
+    lines.append("\n" + "=" * 60)
+    sys.stdout.write('\n'.join(lines) + '\n')
+    sys.stdout.flush()
 
 cli.add_command(show_invalid, 'si')
 
@@ -341,32 +498,36 @@ cli.add_command(create_user, 'cu')
 @click.pass_context
 def show_pending(ctx):
     """Show all valid transactions waiting to be added to a block"""
-    response = requests.get(f"{ctx.obj['cli'].server_url}/pending")
+    response = ctx.obj['cli']._session.get(f"{ctx.obj['cli'].server_url}/pending")
     if response.status_code == 200:
         transactions = response.json()
         
-        print("\n" + "=" * 60)
-        print("⏳ PENDING TRANSACTIONS")
-        print("=" * 60)
-        
+        # Same buffered-output pattern as show-invalid: one write per report
+        lines = [
+            "\n" + "=" * 60,
+            "⏳ PENDING TRANSACTIONS",
+            "=" * 60,
+        ]
+
         if not transactions:
-            print("No pending transactions found")
+            lines.append("No pending transactions found")
         else:
-            print(f"Found {len(transactions)} transaction{'s' if len(transactions) != 1 else ''} waiting to be added to a block\n")
-            
+            lines.append(f"Found {len(transactions)} transaction{'s' if len(transactions) != 1 else ''} waiting to be added to a block\n")
+
             for i, tx in enumerate(transactions, 1):
-                print(f"{i}. Transaction Details:")
-                print(f"   Source:      {tx['source']}")
-                print(f"   Recipient:   {tx['recipient']}")
-                print(f"   Amount:      ${float(tx['amount']):.2f}")
+                lines.append(f"{i}. Transaction Details:")
+                lines.append(f"   Source:      {tx['source']}")
+                lines.append(f"   Recipient:   {tx['recipient']}")
+                lines.append(f"   Amount:      ${float(tx['amount']):.2f}")
                 if 'timestamp' in tx:
-                    from datetime import datetime
                     timestamp = datetime.fromtimestamp(tx['timestamp']).strftime('%Y-%m-%d %H:%M:%S')
-                    print(f"   Timestamp:   {timestamp}")
-                print(f"   " + "-" * 56)
-        
-        print("\nThese transactions will be added to a new block when there are 3 transactions.")
-        print("=" * 60)
+                    lines.append(f"   Timestamp:   {timestamp}")
+                lines.append("   " + "-" * 56)
+
+        lines.append("\nThese transactions will be added to a new block when there are 3 transactions.")
+        lines.append("=" * 60)
+        sys.stdout.write('\n'.join(lines) + '\n')
+        sys.stdout.flush()
     else:
         print("✗ Error fetching pending transactions")
         print(f"Server response: {response.text}")
@@ -374,5 +535,76 @@ def show_pending(ctx):
 
 cli.add_command(show_pending, 'sp')
 
+@cli.command('at-batch')
+@click.argument('file', type=click.Path(exists=True))
+@click.option('--batch-size', default=100, help='Transactions per request')
+@click.pass_context
+def at_batch(ctx, file, batch_size):
+    """Add many transactions in batched requests from a JSON file
+
+    FILE is a JSON list of {"source": ..., "recipient": ..., "amount": ...}
+    objects. Transactions are POSTed in chunks of --batch-size so K
+    transactions cost K/batch-size round-trips instead of K.
+    """
+    with open(file) as f:
+        txs = json.load(f)
+
+    blockchain_cli = ctx.obj['cli']
+    accepted = 0
+    rejected = 0
+    for start in range(0, len(txs), batch_size):
+        chunk = txs[start:start + batch_size]
+        try:
+            response = blockchain_cli._session.post(
+                f"{blockchain_cli.server_url}/transactions/batch",
+                json=chunk
+            )
+        except requests.exceptions.ConnectionError:
+            print("✗ ERROR: Could not connect to the server. Make sure it's running.")
+            return
+
+        if response.status_code != 201:
+            print(f"✗ FAILED: batch starting at {start}: {response.text}")
+            rejected += len(chunk)
+            continue
+
+        data = response.json()
+        accepted += data.get('accepted', 0)
+        rejected += data.get('rejected', 0)
+        for result in data.get('results', []):
+            if not result.get('ok'):
+                tx = chunk[result['index']]
+                print(f"✗ FAILED: {tx['source']} -> {tx['recipient']} "
+                      f"${float(tx['amount']):.2f}: {result.get('error', 'Unknown error')}")
+
+    print(f"\n{accepted} of {len(txs)} transactions added successfully ({rejected} rejected)")
+
+cli.add_command(at_batch, 'atb')
+
+@cli.command('at-many')
+@click.argument('file', type=click.Path(exists=True))
+@click.pass_context
+def at_many(ctx, file):
+    """Add many transactions concurrently from a JSON file
+
+    FILE is a JSON list of {"source": ..., "recipient": ..., "amount": ...}
+    objects. All transactions are submitted in parallel on one session.
+    """
+    with open(file) as f:
+        txs = json.load(f)
+
+    async def submit_all():
+        async with AsyncBlockchainCLI(ctx.obj['cli'].server_url) as async_cli:
+            return await asyncio.gather(
+                *[async_cli.add_transaction(tx['source'], tx['recipient'], tx['amount'])
+                  for tx in txs]
+            )
+
+    results = asyncio.run(submit_all())
+    succeeded = sum(1 for ok in results if ok)
+    print(f"\n{succeeded} of {len(txs)} transactions added successfully")
+
+cli.add_command(at_many, 'atm')
+
 if __name__ == '__main__':
     cli(obj={})
@@ -1,16 +1,68 @@
 import hashlib
-import json
+import logging
+import threading
+import numpy as np
+import orjson
+from collections import OrderedDict, deque
 from time import time
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 from .transaction import Transaction
 
+# Prefer the usedforsecurity=False constructor (Python >= 3.9) so hashing
+# goes straight to OpenSSL's implementation (SHA-NI on supported CPUs)
+# without any FIPS wrapper indirection.
+try:
+    hashlib.sha256(b'', usedforsecurity=False)
+
+    def _sha256(data: bytes):
+        return hashlib.sha256(data, usedforsecurity=False)
+except TypeError:  # pragma: no cover - older Python
+    _sha256 = hashlib.sha256
+
+logger = logging.getLogger(__name__)
+
+_ZERO_HASH = '0' * 64
+
+# Specialized block hashers, keyed by transaction count. Blocks are cut
+# at a fixed pending size, so in practice one specialization covers
+# nearly every block; the generated function joins the header and the
+# cached per-transaction bytes with no loop or indexing overhead.
+_HASHERS: Dict[int, object] = {}
+
+def _hasher_for(n: int):
+    fn = _HASHERS.get(n)
+    if fn is None:
+        parts = ', '.join(['header'] + [f'txs[{i}].hash_bytes' for i in range(n)])
+        source = (
+            'def _hash_block_n(header, txs):\n'
+            f"    return _sha256(b''.join(({parts},))).hexdigest()\n"
+        )
+        namespace = {'_sha256': _sha256}
+        exec(compile(source, '<block-hasher>', 'exec'), namespace)
+        fn = _HASHERS[n] = namespace['_hash_block_n']
+    return fn
+
 class Blockchain:
+    # The genesis hash never changes; compute it once instead of on every reset
+    _GENESIS_HASH = _sha256(b'genesis').hexdigest()
+
     def __init__(self):
+        # Serializes mutations when the app runs under a threaded WSGI
+        # server; reads stay lock-free (GIL-consistent snapshots).
+        self._write_lock = threading.RLock()
         self.chain: List[Dict] = []
         self.pending_transactions: List[Transaction] = []
-        self.balances: Dict[str, float] = {}
-        self.invalid_transactions: List[Transaction] = []
+        # Usernames are interned to small integer IDs at creation time;
+        # balances live in a flat list of integer cents indexed by ID, so
+        # the transaction hot path does one string-keyed lookup per user
+        # instead of repeated dict hashing on every read and write.
+        self._name2id: Dict[str, int] = {}
+        self._bal: List[int] = []
+        self._mtimes: List[float] = []
+        # Bounded: the invalid log is diagnostic, so old entries may be
+        # dropped rather than letting rejected spam grow memory forever.
+        self.invalid_transactions: deque = deque(maxlen=1000)
         self.reset()
 
     def reset(self) -> None:
@@ -20,62 +72,79 @@ class Blockchain:
             'index': 1,
             'timestamp': time(),
             'transactions': [],
-            'previous_hash': '0' * 64,
-            'hash': self._hash_block('genesis')
+            'previous_hash': _ZERO_HASH,
+            'hash': self._GENESIS_HASH
         }
         
         # Reset all state
-        self.chain = [genesis_block]
-        self.pending_transactions = []
-        self.balances = {}
-        self.invalid_transactions = []
-        print("Blockchain reset complete: All transactions, balances, and history have been cleared.")
+        with self._write_lock:
+            self.chain = [genesis_block]
+            self.pending_transactions = []
+            self._name2id = {}
+            self._bal = []
+            self._mtimes = []
+            self.invalid_transactions = deque(maxlen=1000)
+            self._pending_dicts = None
+            self._block_json_cache = OrderedDict()
+            self._latest_hash = self._GENESIS_HASH
+            self._tx_count = 0
+        logger.info("Blockchain reset complete: All transactions, balances, and history have been cleared.")
 
     def create_user(self, username: str) -> bool:
         """Explicitly create a new user with a starting balance of $100"""
         if not username or not isinstance(username, str):
-            print("Error: Username must be a non-empty string")
+            logger.warning("Username must be a non-empty string")
             return False
             
-        if username in self.balances:
-            print(f"Error: User '{username}' already exists")
-            return False
-            
-        self.balances[username] = 100.0
-        print(f"New user '{username}' created with starting balance of $100.00")
+        with self._write_lock:
+            if username in self._name2id:
+                logger.warning(f"User '{username}' already exists")
+                return False
+
+            self._name2id[username] = len(self._bal)
+            self._bal.append(100 * 100)  # $100.00 in cents
+            self._mtimes.append(time())
+        logger.info(f"New user '{username}' created with starting balance of $100.00")
         return True
         
-    def add_transaction(self, source: str, recipient: str, amount: float) -> bool:
-        """Add a new transaction to the pending transactions list"""
-        # Check if users exist
+    def add_transaction(self, source: str, recipient: str,
+                        amount: float) -> Tuple[bool, Optional[Transaction]]:
+        """Add a new transaction to the pending transactions list
+
+        Returns ``(True, None)`` on acceptance, or ``(False, tx)`` where
+        ``tx`` carries the validation error, so callers never have to
+        peek at the tail of the shared invalid log to learn why a
+        submission was rejected.
+        """
+        with self._write_lock:
+            return self._add_transaction_locked(source, recipient, amount)
+
+    def _add_transaction_locked(self, source: str, recipient: str,
+                                amount: float) -> Tuple[bool, Optional[Transaction]]:
+        # Resolve each username to its interned ID with a single lookup
         transaction = Transaction(source, recipient, amount)
-        
-        if source not in self.balances:
+        sid = self._name2id.get(source, -1)
+        rid = self._name2id.get(recipient, -1)
+
+        if sid < 0:
             transaction.is_valid = False
             transaction.validation_error = f"Source user '{source}' does not exist"
+            transaction.missing_user = source
             self.invalid_transactions.append(transaction)
-            print(f"\n=== INVALID TRANSACTION ===")
-            print(f"From: {source}")
-            print(f"To: {recipient}")
-            print(f"Amount: ${amount:.2f}")
-            print(f"Error: {transaction.validation_error}")
-            print("===========================\n")
-            return False
-            
-        if recipient not in self.balances:
+            self._log_invalid(transaction)
+            return False, transaction
+
+        if rid < 0:
             transaction.is_valid = False
             transaction.validation_error = f"Recipient user '{recipient}' does not exist"
+            transaction.missing_user = recipient
             self.invalid_transactions.append(transaction)
-            print(f"\n=== INVALID TRANSACTION ===")
-            print(f"From: {source}")
-            print(f"To: {recipient}")
-            print(f"Amount: ${amount:.2f}")
-            print(f"Error: {transaction.validation_error}")
-            print("===========================\n")
-            return False
+            self._log_invalid(transaction)
+            return False, transaction
+
+        amount_cents = round(amount * 100)
+        src_bal = self._bal[sid]
 
-        transaction = Transaction(source, recipient, amount)
-        
         # Validate transaction
         if source == recipient:
             transaction.is_valid = False
@@ -83,39 +152,112 @@ class Blockchain:
         elif amount <= 0:
             transaction.is_valid = False
             transaction.validation_error = f"Invalid amount: {amount}. Amount must be positive"
-        elif self.balances[source] < amount:
+        elif src_bal < amount_cents:
             transaction.is_valid = False
-            transaction.validation_error = f"Insufficient balance: {source} has ${self.balances[source]:.2f} but needs ${amount:.2f}"
-        
+            transaction.validation_error = f"Insufficient balance: {source} has ${src_bal / 100:.2f} but needs ${amount:.2f}"
+
         if not transaction.is_valid:
             self.invalid_transactions.append(transaction)
-            print(f"\n=== INVALID TRANSACTION ===")
-            print(f"From: {source}")
-            print(f"To: {recipient}")
-            print(f"Amount: ${amount:.2f}")
-            print(f"Error: {transaction.validation_error}")
-            print(f"Current balance of {source}: ${self.balances[source]:.2f}")
-            print(f"Current balance of {recipient}: ${self.balances[recipient]:.2f}")
-            print("===========================\n")
-            return False
+            self._log_invalid(transaction)
+            return False, transaction
 
         # If we get here, the transaction is valid
-        self.balances[source] -= amount
-        self.balances[recipient] += amount
+        self._bal[sid] = src_bal - amount_cents
+        self._bal[rid] += amount_cents
+        self._mtimes[sid] = self._mtimes[rid] = time()
         self.pending_transactions.append(transaction)
-        
-        print(f"\n=== VALID TRANSACTION ===")
-        print(f"From: {source} (${self.balances[source] + amount:.2f} -> ${self.balances[source]:.2f})")
-        print(f"To: {recipient} (${self.balances[recipient] - amount:.2f} -> ${self.balances[recipient]:.2f})")
-        print(f"Amount: ${amount:.2f}")
-        print("======================\n")
-        
+        self._pending_dicts = None
+
+        logger.debug(
+            "Valid transaction: %s -> %s for $%.2f (%s: $%.2f, %s: $%.2f)",
+            source, recipient, amount,
+            source, self._bal[sid] / 100, recipient, self._bal[rid] / 100
+        )
+
         # Create a new block if we have 3 transactions
         if len(self.pending_transactions) >= 3:
-            print("Creating new block...")
+            logger.debug("Creating new block...")
             self.create_block()
             
-        return True
+        return True, None
+
+    def _log_invalid(self, transaction: Transaction) -> None:
+        """Log a rejected transaction without paying formatting cost when disabled"""
+        logger.debug(
+            "Invalid transaction: %s -> %s for $%.2f: %s",
+            transaction.source, transaction.recipient,
+            transaction.amount, transaction.validation_error
+        )
+
+    def add_transactions_bulk(self, sources: List[str], recipients: List[str],
+                              amounts: List[float]) -> List[Dict]:
+        """Vectorized batch ingest of parallel source/recipient/amount arrays
+
+        Structural validation (user existence, positive amounts, distinct
+        endpoints) runs as NumPy masks over the whole batch in one pass.
+        The balance-sufficiency check stays sequential because each row's
+        available funds depend on the rows before it, but it runs against
+        a flat int64 balance vector and writes back to the dict once at
+        the end.
+        """
+        with self._write_lock:
+            n = len(amounts)
+            ids = self._name2id
+
+            src_idx = np.fromiter((ids.get(s, -1) for s in sources), dtype=np.int64, count=n)
+            dst_idx = np.fromiter((ids.get(r, -1) for r in recipients), dtype=np.int64, count=n)
+            amount_arr = np.asarray(amounts, dtype=np.float64)
+            cents = np.rint(amount_arr * 100).astype(np.int64)
+            candidate = (src_idx >= 0) & (dst_idx >= 0) & (amount_arr > 0) & (src_idx != dst_idx)
+
+            bal = np.asarray(self._bal, dtype=np.int64)
+            now = time()
+            results = []
+
+            for i in range(n):
+                source, recipient = sources[i], recipients[i]
+                amount = float(amount_arr[i])
+                transaction = Transaction(source, recipient, amount)
+
+                if not candidate[i]:
+                    transaction.is_valid = False
+                    if src_idx[i] < 0:
+                        transaction.validation_error = f"Source user '{source}' does not exist"
+                        transaction.missing_user = source
+                    elif dst_idx[i] < 0:
+                        transaction.validation_error = f"Recipient user '{recipient}' does not exist"
+                        transaction.missing_user = recipient
+                    elif source == recipient:
+                        transaction.validation_error = "Source and recipient cannot be the same"
+                    else:
+                        transaction.validation_error = f"Invalid amount: {amount}. Amount must be positive"
+                elif bal[src_idx[i]] < cents[i]:
+                    transaction.is_valid = False
+                    transaction.validation_error = (
+                        f"Insufficient balance: {source} has ${bal[src_idx[i]] / 100:.2f} "
+                        f"but needs ${amount:.2f}"
+                    )
+
+                if not transaction.is_valid:
+                    self.invalid_transactions.append(transaction)
+                    self._log_invalid(transaction)
+                    results.append({'index': i, 'ok': False, 'error': transaction.validation_error})
+                    continue
+
+                bal[src_idx[i]] -= cents[i]
+                bal[dst_idx[i]] += cents[i]
+                self._mtimes[src_idx[i]] = self._mtimes[dst_idx[i]] = now
+                self.pending_transactions.append(transaction)
+                self._pending_dicts = None
+                results.append({'index': i, 'ok': True})
+
+                if len(self.pending_transactions) >= 3:
+                    self.create_block()
+
+            # One write-back pass instead of two list writes per transaction
+            self._bal = bal.tolist()
+
+            return results
 
     def create_block(self) -> Dict:
         """Create a new block with pending transactions"""
@@ -124,79 +266,168 @@ class Blockchain:
 
         block = {
             'index': len(self.chain) + 1,
-            'timestamp': datetime.utcnow().isoformat(),
-            'transactions': [transaction.to_dict() for transaction in self.pending_transactions],
+            'timestamp': time(),
+            'transactions': [transaction.as_dict for transaction in self.pending_transactions],
             'previous_hash': self.get_latest_block_hash(),
             'hash': None
         }
-        
-        block['hash'] = self._hash_block(block)
+
+        # Hash through a specialization unrolled for this transaction
+        # count: one join of the header and cached per-transaction bytes,
+        # one digest, no per-transaction Python loop.
+        header = f"{block['index']}|{block['timestamp']}|{block['previous_hash']}|".encode()
+        block['hash'] = _hasher_for(len(self.pending_transactions))(
+            header, self.pending_transactions
+        )
+
         self.chain.append(block)
+        self._latest_hash = block['hash']
+        self._tx_count += len(self.pending_transactions)
         self.pending_transactions = []
-        
+        self._pending_dicts = None
+
         return block
 
     def get_latest_block_hash(self) -> str:
         """Get the hash of the latest block in the chain"""
-        if not self.chain:
-            return "0" * 64  # Genesis block hash
-        return self.chain[-1]['hash']
+        return self._latest_hash
 
     def _hash_block(self, block: Dict) -> str:
-        """Create a SHA-256 hash of a block"""
-        block_string = json.dumps(block, sort_keys=True).encode()
-        return hashlib.sha256(block_string).hexdigest()
+        """Create a SHA-256 hash of a block
+
+        Blocks have a fixed schema, so the fields are streamed into the
+        hasher directly; no intermediate JSON tree is built just to
+        produce a digest.
+        """
+        hasher = _sha256(
+            f"{block['index']}|{block['timestamp']}|{block['previous_hash']}|".encode()
+        )
+        for tx in block['transactions']:
+            hasher.update(
+                f"{tx['source']}|{tx['recipient']}|{tx['amount']}|{tx['timestamp']}|".encode()
+            )
+        return hasher.hexdigest()
+
+    def _public_block(self, block: Dict) -> Dict:
+        """Return a copy of a block without private cache keys"""
+        return {k: v for k, v in block.items() if not k.startswith('_')}
+
+    def iter_chain_json(self):
+        """Yield the /chain payload as JSON byte chunks
 
-    def get_balances(self) -> Dict[str, float]:
-        """Get current balances of all users"""
-        return self.balances
+        Serializes one block at a time so a long chain never has to be
+        materialized as a single response buffer.
+        """
+        yield b'{"chain":['
+        for i, block in enumerate(self.chain):
+            if i:
+                yield b','
+            yield orjson.dumps(self._public_block(block))
+        yield b'],"length":%d}' % len(self.chain)
+
+    def get_balances(self, since: Optional[float] = None) -> Dict[str, float]:
+        """Get current balances of all users
+
+        When ``since`` is given, only balances changed after that
+        timestamp are returned, so pollers transfer just the delta.
+        """
+        bal, mtimes = self._bal, self._mtimes
+        if since is None:
+            return {user: bal[i] / 100 for user, i in self._name2id.items()}
+        return {
+            user: bal[i] / 100 for user, i in self._name2id.items()
+            if mtimes[i] > since
+        }
+
+    @property
+    def balances(self) -> Dict[str, int]:
+        """Dict view of balances in cents, rebuilt on access
+
+        Kept for external readers; the hot paths go through the interned
+        ID arrays directly.
+        """
+        bal = self._bal
+        return {user: bal[i] for user, i in self._name2id.items()}
+
+    def get_balance(self, username: str) -> Optional[float]:
+        """Get the balance for a single user in dollars, or None if they don't exist"""
+        uid = self._name2id.get(username, -1)
+        return None if uid < 0 else self._bal[uid] / 100
 
     def get_invalid_transactions(self) -> Dict[str, List[Dict]]:
         """Get all invalid transactions with their error messages"""
         return {
-            'invalid_transactions': [{
-                'source': tx.source,
-                'recipient': tx.recipient,
-                'amount': tx.amount,
-                'timestamp': tx.timestamp,
-                'validation_error': tx.validation_error
-            } for tx in self.invalid_transactions]
+            'invalid_transactions': [tx.as_dict for tx in self.invalid_transactions]
         }
         
     def get_pending_transactions(self) -> List[Dict]:
-        """Get all valid transactions that haven't been added to a block yet"""
-        return [t.to_dict() for t in self.pending_transactions]
+        """Get all valid transactions that haven't been added to a block yet
+
+        The list is cached and only rebuilt after the pending set
+        mutates, so repeated /pending polls between transactions are
+        a single attribute read.
+        """
+        if self._pending_dicts is None:
+            self._pending_dicts = [t.as_dict for t in self.pending_transactions]
+        return self._pending_dicts
+
+    _BLOCK_JSON_CACHE_SIZE = 128
+
+    def block_json(self, index: int) -> Optional[bytes]:
+        """Serialized JSON bytes for a single block
+
+        Blocks are immutable once appended, so entries never go stale;
+        an LRU bound keeps memory flat while the recently-queried
+        (typically newest) blocks stay hot.
+        """
+        if not 1 <= index <= len(self.chain):
+            return None
+        cached = self._block_json_cache.get(index)
+        if cached is not None:
+            self._block_json_cache.move_to_end(index)
+            return cached
+        data = orjson.dumps(self._public_block(self.chain[index - 1]))
+        self._block_json_cache[index] = data
+        if len(self._block_json_cache) > self._BLOCK_JSON_CACHE_SIZE:
+            self._block_json_cache.popitem(last=False)
+        return data
 
     def get_block(self, index: int) -> Optional[Dict]:
         """Get a block by its index (1-based)"""
         if 1 <= index <= len(self.chain):
-            return self.chain[index - 1]
+            return self._public_block(self.chain[index - 1])
         return None
 
     def export_blockchain(self, filepath: str) -> bool:
-        """Export complete blockchain data to a JSON file"""
+        """Export complete blockchain data to a JSON file
+
+        The chain section is streamed to disk block by block, so exports
+        use constant memory regardless of chain length.
+        """
         try:
-            current_time = datetime.utcnow().isoformat()
-            blockchain_data = {
-                'timestamp': current_time,
-                'chain': self.chain,
-                'pending_transactions': [tx.to_dict() for tx in self.pending_transactions],
-                'invalid_transactions': [tx.to_dict() for tx in self.invalid_transactions],
-                'balances': self.balances,
-                'stats': {
-                    'block_count': len(self.chain),
-                    'transaction_count': sum(len(block.get('transactions', [])) for block in self.chain),
-                    'user_count': len(self.balances),
-                    'pending_transaction_count': len(self.pending_transactions),
-                    'invalid_transaction_count': len(self.invalid_transactions)
-                }
+            stats = {
+                'block_count': len(self.chain),
+                'transaction_count': self._tx_count,
+                'user_count': len(self._bal),
+                'pending_transaction_count': len(self.pending_transactions),
+                'invalid_transaction_count': len(self.invalid_transactions)
             }
-            
-            with open(filepath, 'w') as f:
-                json.dump(blockchain_data, f, indent=2)
-                
-            print(f"Blockchain data successfully exported to {filepath}")
+
+            with open(filepath, 'wb') as f:
+                f.write(b'{"timestamp":' + orjson.dumps(datetime.utcnow().isoformat()))
+                f.write(b',"chain":[')
+                for i, block in enumerate(self.chain):
+                    if i:
+                        f.write(b',')
+                    f.write(orjson.dumps(self._public_block(block)))
+                f.write(b']')
+                f.write(b',"pending_transactions":' + orjson.dumps([tx.as_dict for tx in self.pending_transactions]))
+                f.write(b',"invalid_transactions":' + orjson.dumps([tx.as_dict for tx in self.invalid_transactions]))
+                f.write(b',"balances":' + orjson.dumps(self.get_balances()))
+                f.write(b',"stats":' + orjson.dumps(stats) + b'}')
+
+            logger.info(f"Blockchain data successfully exported to {filepath}")
             return True
         except Exception as e:
-            print(f"Failed to export blockchain data: {str(e)}")
+            logger.error(f"Failed to export blockchain data: {str(e)}")
             return False
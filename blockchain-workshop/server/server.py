@@ -1,10 +1,18 @@
-from flask import Flask, jsonify, request
+import logging
+import os
+
+import orjson
+from flask import Flask, Response, request, stream_with_context
 from .blockchain import Blockchain
 from .transaction import Transaction
 
 app = Flask(__name__)
 blockchain = Blockchain()
 
+def ojson(obj, status=200):
+    """JSON response via orjson, bypassing jsonify's stdlib serializer"""
+    return app.response_class(orjson.dumps(obj), status=status, mimetype='application/json')
+
 @app.route('/transactions/new', methods=['POST'])
 def new_transaction():
     data = request.get_json()
@@ -13,54 +21,82 @@ def new_transaction():
     if not all(k in data for k in required):
         return 'Missing values', 400
     
-    success = blockchain.add_transaction(
+    success, failed = blockchain.add_transaction(
         source=data['source'],
         recipient=data['recipient'],
         amount=float(data['amount'])
     )
     
     if not success:
-        # Find the last invalid transaction and return its error message
-        if blockchain.invalid_transactions:
-            last_tx = blockchain.invalid_transactions[-1]
-            error_msg = last_tx.validation_error
-            return jsonify({
-                'error': 'Invalid transaction',
-                'reason': error_msg
-            }), 400
-        else:
-            return 'Invalid transaction (unknown reason)', 400
+        error_body = {
+            'error': 'Invalid transaction',
+            'reason': failed.validation_error
+        }
+        if failed.missing_user:
+            error_body['missing_user'] = failed.missing_user
+        return ojson(error_body, 400)
     
     return 'Transaction added successfully', 201
 
+@app.route('/transactions/batch', methods=['POST'])
+def new_transaction_batch():
+    data = request.get_json()
+    if not isinstance(data, list):
+        return ojson({'error': 'Expected a JSON list of transactions'}, 400)
+
+    required = ['source', 'recipient', 'amount']
+    for tx in data:
+        if not all(k in tx for k in required):
+            return ojson({'error': 'Missing values in one or more transactions'}, 400)
+
+    # Split into the parallel arrays the vectorized ingest expects
+    sources = [tx['source'] for tx in data]
+    recipients = [tx['recipient'] for tx in data]
+    amounts = [float(tx['amount']) for tx in data]
+
+    results = blockchain.add_transactions_bulk(sources, recipients, amounts)
+    accepted = sum(1 for r in results if r['ok'])
+
+    return ojson({
+        'accepted': accepted,
+        'rejected': len(results) - accepted,
+        'results': results
+    }, 201)
+
 @app.route('/chain', methods=['GET'])
 def full_chain():
-    response = {
-        'chain': blockchain.chain,
-        'length': len(blockchain.chain),
-    }
-    return jsonify(response), 200
+    # Stream block-by-block: constant memory even for long chains
+    return Response(stream_with_context(blockchain.iter_chain_json()),
+                    mimetype='application/json'), 200
 
 @app.route('/block/<int:index>', methods=['GET'])
 def get_block(index):
-    block = blockchain.get_block(index)
+    block = blockchain.block_json(index)
     if block is None:
         return 'Block not found', 404
-    return jsonify(block), 200
+    return Response(block, mimetype='application/json'), 200
 
 @app.route('/balances', methods=['GET'])
 def get_balances():
-    return jsonify(blockchain.get_balances()), 200
+    since = request.args.get('since', type=float)
+    return ojson(blockchain.get_balances(since))
+
+@app.route('/balances/<username>', methods=['GET'])
+def get_balance(username):
+    balance = blockchain.get_balance(username)
+    if balance is None:
+        return ojson({'error': f"User '{username}' does not exist"}, 404)
+    return ojson({'username': username, 'balance': balance})
 
 @app.route('/invalid', methods=['GET'])
 def get_invalid_transactions():
     """Get all invalid transactions"""
-    return jsonify(blockchain.get_invalid_transactions()), 200
+    return ojson(blockchain.get_invalid_transactions())
 
 @app.route('/pending', methods=['GET'])
 def get_pending_transactions():
     """Get all valid transactions waiting to be added to a block"""
-    return jsonify(blockchain.get_pending_transactions()), 200
+    return ojson(blockchain.get_pending_transactions())
 
 @app.route('/reset', methods=['POST'])
 def reset():
@@ -73,7 +109,7 @@ def reset():
 def export_blockchain():
     data = request.get_json()
     if not data or 'filepath' not in data:
-        return jsonify({'error': 'Filepath is required'}), 400
+        return ojson({'error': 'Filepath is required'}, 400)
         
     filepath = data['filepath']
     
@@ -84,16 +120,16 @@ def export_blockchain():
     success = blockchain.export_blockchain(filepath)
     
     if success:
-        return jsonify({
+        return ojson({
             'success': True,
             'message': f'Blockchain data exported successfully to {filepath}',
             'filepath': filepath
-        }), 200
+        })
     else:
-        return jsonify({
+        return ojson({
             'success': False,
             'error': f'Failed to export blockchain data to {filepath}'
-        }), 500
+        }, 500)
 
 @app.route('/users/create', methods=['POST'])
 def create_user():
@@ -110,22 +146,62 @@ def create_user():
     else:
         return 'Failed to create user. User may already exist.', 400
 
+def _check_sha_ni():
+    """Warn when block hashing will not use hardware-accelerated SHA-256
+
+    hashlib delegates to OpenSSL, which only uses the SHA-NI fast path
+    when the CPU advertises it and the OpenSSL build is recent enough.
+    This is a diagnostic only; hashing still works on the software path.
+    """
+    import ssl
+
+    openssl_ok = ssl.OPENSSL_VERSION_INFO >= (1, 1, 1)
+    sha_ni = False
+    try:
+        with open('/proc/cpuinfo') as f:
+            sha_ni = 'sha_ni' in f.read()
+    except OSError:
+        # Non-Linux platform; nothing to sniff
+        return
+
+    if not (openssl_ok and sha_ni):
+        logging.getLogger(__name__).warning(
+            "SHA-NI not available (openssl=%s, cpu flag=%s): "
+            "block hashing will use software SHA-256",
+            ssl.OPENSSL_VERSION, sha_ni
+        )
+
 def load_transactions_from_csv():
     """This function is kept for compatibility but returns an empty list"""
     print("File I/O has been disabled. Starting with an empty blockchain.")
     return []
 
 def run_server(port=5000):
-    """Run the Flask server"""
+    """Run the Flask server
+
+    This uses Werkzeug's threaded dev server, which is fine for the
+    workshop. For real parallelism on independent requests, run the app
+    under gunicorn instead; blockchain mutations are already guarded by
+    a write lock, so threaded workers are safe:
+
+        gunicorn server.server:app -w $(nproc) -k gthread --threads 4 -b 0.0.0.0:5000
+    """
     global blockchain
-    
+
+    # Keep per-transaction logging off the hot path by default; set
+    # BLOCKCHAIN_LOG_TX=1 to see individual transaction traces.
+    log_tx = os.environ.get('BLOCKCHAIN_LOG_TX') == '1'
+    logging.basicConfig(level=logging.DEBUG if log_tx else logging.WARNING)
+
+    _check_sha_ni()
+
     # Initialize empty blockchain
     blockchain = Blockchain()
     print("Initialized new empty blockchain")
     print("Current balances:", blockchain.balances)
     
     print(f"Starting server on port {port}...")
-    app.run(host='0.0.0.0', port=port)
+    app.run(host='0.0.0.0', port=port, threaded=True)
 
 if __name__ == '__main__':
     run_server()
@@ -1,8 +1,8 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from time import time
 from typing import Optional
-from datetime import datetime
 
-@dataclass
+@dataclass(slots=True)
 class Transaction:
     source: str
     recipient: str
@@ -10,18 +10,58 @@ class Transaction:
     timestamp: float = None
     is_valid: bool = True
     validation_error: Optional[str] = None
+    missing_user: Optional[str] = None
+    # Slot-backed caches; cached_property needs an instance __dict__,
+    # which slots removes, so the memoization is explicit here.
+    _as_dict: Optional[dict] = field(default=None, init=False, repr=False, compare=False)
+    _hash_bytes: Optional[bytes] = field(default=None, init=False, repr=False, compare=False)
 
     def __post_init__(self):
         if self.timestamp is None:
-            self.timestamp = datetime.utcnow().timestamp()
-            
+            # time() is a direct clock read; no datetime object is built
+            self.timestamp = time()
+
+    def __setattr__(self, name, value):
+        # Validation fields may be set after a serialization (e.g. a
+        # transaction logged before being re-checked); drop the cached
+        # dict so it can never serve stale values.
+        if name in ('is_valid', 'validation_error') and getattr(self, '_as_dict', None) is not None:
+            object.__setattr__(self, '_as_dict', None)
+        object.__setattr__(self, name, value)
+
+    @property
+    def as_dict(self) -> dict:
+        """Dictionary form for JSON serialization, computed once per transaction
+
+        Transactions are effectively immutable by the time they are
+        serialized (validation fields are set before a transaction is
+        queued), so the dict is built a single time and reused.
+        """
+        if self._as_dict is None:
+            self._as_dict = {
+                'source': self.source,
+                'recipient': self.recipient,
+                'amount': self.amount,
+                'timestamp': self.timestamp,
+                'is_valid': self.is_valid,
+                'validation_error': self.validation_error
+            }
+        return self._as_dict
+
     def to_dict(self) -> dict:
         """Convert transaction to a dictionary for JSON serialization"""
-        return {
-            'source': self.source,
-            'recipient': self.recipient,
-            'amount': self.amount,
-            'timestamp': self.timestamp,
-            'is_valid': self.is_valid,
-            'validation_error': self.validation_error
-        }
+        return self.as_dict
+
+    @property
+    def hash_bytes(self) -> bytes:
+        """Hash-preimage bytes for this transaction, computed once
+
+        Matches the field order Blockchain._hash_block streams for a
+        transaction dict, so a block hash can be fed these cached bytes
+        directly instead of re-formatting every field per block.
+        """
+        if self._hash_bytes is None:
+            self._hash_bytes = (
+                f"{self.source}|{self.recipient}|{self.amount}|{self.timestamp}|".encode()
+            )
+        return self._hash_bytes
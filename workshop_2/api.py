@@ -6,6 +6,27 @@ from typing import Dict, Any, Tuple
 from blockchain import Blockchain, Transaction, Block
 from node import Node
 
+# Peers broadcast with msgpack bodies when both sides support it; JSON
+# stays fully supported for older peers and direct API calls.
+try:
+    import msgspec.msgpack
+    _msgpack_decode = msgspec.msgpack.Decoder().decode
+except ImportError:
+    _msgpack_decode = None
+
+
+def _get_request_payload():
+    """Decode the request body by Content-Type (msgpack or JSON).
+
+    Returns None when the body is msgpack but msgspec is not installed,
+    so the caller can answer 415 and the sender falls back to JSON.
+    """
+    if (request.content_type or '').startswith('application/msgpack'):
+        if _msgpack_decode is None:
+            return None
+        return _msgpack_decode(request.get_data())
+    return request.get_json()
+
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger('api')
@@ -38,6 +59,12 @@ class BlockchainAPI:
             }
             return jsonify(chain_data), 200
             
+        @self.app.route('/chain/length', methods=['GET'])
+        def get_chain_length():
+            # Lightweight probe used by consensus: peers compare lengths
+            # first and only the longest chain's body is transferred.
+            return jsonify({'length': len(self.node.blockchain.chain)}), 200
+
         @self.app.route('/chain/validate', methods=['GET'])
         def validate_chain():
             is_valid = self.node.blockchain.is_chain_valid()
@@ -50,7 +77,9 @@ class BlockchainAPI:
         # Transaction endpoints
         @self.app.route('/transactions/new', methods=['POST'])
         def new_transaction():
-            values = request.get_json()
+            values = _get_request_payload()
+            if values is None:
+                return jsonify({'message': 'Unsupported content type'}), 415
             
             # Check required fields
             required_fields = ['sender', 'recipient', 'amount']
@@ -88,6 +117,25 @@ class BlockchainAPI:
                 response = {'message': 'Failed to add transaction', 'transaction': transaction.to_dict()}
                 return jsonify(response), 400
                 
+        @self.app.route('/transactions/batch', methods=['POST'])
+        def new_transaction_batch():
+            values = _get_request_payload()
+            if values is None:
+                return jsonify({'message': 'Unsupported content type'}), 415
+
+            if not isinstance(values, list):
+                return jsonify({'message': 'Expected a list of transactions'}), 400
+
+            logger.info(f"Received batch of {len(values)} transactions from peer node")
+            accepted = self.node.handle_new_transactions(values)
+
+            response = {
+                'message': f'Accepted {accepted} of {len(values)} transactions',
+                'accepted': accepted,
+                'received': len(values)
+            }
+            return jsonify(response), 201
+
         @self.app.route('/transactions/pending', methods=['GET'])
         def get_pending_transactions():
             transactions = [tx.to_dict() for tx in self.node.blockchain.pending_transactions]
@@ -106,7 +154,9 @@ class BlockchainAPI:
         # Block endpoints
         @self.app.route('/blocks/new', methods=['POST'])
         def new_block():
-            values = request.get_json()
+            values = _get_request_payload()
+            if values is None:
+                return jsonify({'message': 'Unsupported content type'}), 415
             
             try:
                 # Check if this is from the API or forwarded from another node
@@ -191,6 +241,45 @@ class BlockchainAPI:
             return jsonify({'message': 'Mining stopped'}), 200
             
         # Node endpoints
+        @self.app.route('/ping', methods=['GET'])
+        def ping():
+            # Zero-body liveness probe: unlike /nodes/info it does no
+            # peer-table walk, so health checks cost the server nothing
+            return '', 200
+
+        @self.app.route('/nodes/sync', methods=['POST'])
+        def sync_node():
+            values = request.get_json()
+
+            if not values or not all(k in values for k in ['host', 'port', 'node_type']):
+                return jsonify({'message': 'Error: Missing required node information'}), 400
+
+            # Record the announcing node as active
+            self.node.record_active_node(
+                values.get('host'),
+                values.get('port'),
+                values.get('node_type'),
+                values.get('name')
+            )
+
+            # Return only activity records newer than the version the
+            # caller last saw, instead of the whole active-node table.
+            # since_version arrives as a query parameter so announcers
+            # can reuse one encoded body for every peer.
+            since_version = request.args.get('since_version', values.get('since_version', 0))
+            version, delta = self.node.get_activity_delta(int(since_version))
+
+            return jsonify({
+                'node': {
+                    'host': self.node.host,
+                    'port': self.node.port,
+                    'node_type': 'miner' if self.node.miner_mode else 'full',
+                    'name': f"Node {self.node.host}:{self.node.port}"
+                },
+                'version': version,
+                'delta': delta
+            }), 200
+
         @self.app.route('/nodes/announce', methods=['POST'])
         def announce_node():
             values = request.get_json()
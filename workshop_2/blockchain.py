@@ -1,6 +1,10 @@
 import hashlib
-import json
+import orjson
+import os
 import time
+from collections import deque
+import numpy as np
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
 from typing import List, Dict, Any, Optional
 import uuid
 import logging
@@ -10,10 +14,49 @@ from Crypto.Hash import SHA256
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger('blockchain')
 
+# Amounts and balances are fixed-point int64 in minor units
+# (satoshi-style): exact money arithmetic, integer compares, and no
+# float rounding drift. Major-unit floats appear only at the JSON/API
+# boundary.
+AMOUNT_SCALE = 10 ** 8
+
+def _grind_chunk(args):
+    """Search one disjoint nonce range for a digest meeting the difficulty.
+
+    Module-level so worker processes can import it; returns
+    ``(nonce, digest)`` on success or ``None`` if the range is dry.
+    """
+    prefix, suffix, difficulty, start, count = args
+    base = hashlib.sha256(prefix)
+    zero_bytes, odd_nibble = divmod(difficulty, 2)
+    zeros = b'\x00' * zero_bytes
+    for nonce in range(start, start + count):
+        h = base.copy()
+        h.update(b'%d' % nonce)
+        if suffix:
+            h.update(suffix)
+        digest = h.digest()
+        if digest[:zero_bytes] == zeros and (not odd_nibble or digest[zero_bytes] < 16):
+            return nonce, digest
+    return None
+
+
+def _verify_block(block: 'Block') -> bool:
+    """Check one block's hash integrity and proof-of-work.
+
+    Depends only on the block itself, so candidate-chain verification
+    can fan these checks out across worker processes.
+    """
+    return block.hash == block.calculate_hash() and block.is_hash_valid()
+
+
 class Transaction:
     """Represents a financial transaction on the blockchain."""
-    
-    def __init__(self, sender: str, recipient: str, amount: float, timestamp: Optional[float] = None, signature: str = None):
+
+    __slots__ = ('sender', 'recipient', 'amount', 'timestamp', 'signature', '_hash',
+                 '_dict_cache', '_encoded_cache')
+
+    def __init__(self, sender: str, recipient: str, amount: float, timestamp: Optional[float] = None, signature: bytes = None):
         """
         Initialize a new transaction.
         
@@ -22,23 +65,39 @@ class Transaction:
             recipient: The address of the recipient
             amount: The amount to transfer
             timestamp: Transaction time (defaults to current time)
-            signature: Optional transaction signature for future use
+            signature: Optional 16-byte transaction signature for future use
         """
         self.sender = sender
         self.recipient = recipient
-        self.amount = amount
+        self.amount = round(amount * AMOUNT_SCALE)
         self.timestamp = timestamp or time.time()
-        self.signature = signature or str(uuid.uuid4())
+        # Raw UUID bytes: half the preimage footprint of the old 36-char
+        # string form; hex-encoded only at the JSON boundary.
+        self.signature = signature or uuid.uuid4().bytes
+        self._hash = None
+        # Serialization caches: transactions are immutable once built,
+        # so the dict and its JSON bytes are computed at most once even
+        # when a transaction is re-broadcast or re-encoded per peer.
+        self._dict_cache = None
+        self._encoded_cache = None
         
     def to_dict(self) -> Dict[str, Any]:
-        """Convert transaction to dictionary format."""
-        return {
-            'sender': self.sender,
-            'recipient': self.recipient,
-            'amount': self.amount,
-            'timestamp': self.timestamp,
-            'signature': self.signature
-        }
+        """Convert transaction to dictionary format (cached)."""
+        if self._dict_cache is None:
+            self._dict_cache = {
+                'sender': self.sender,
+                'recipient': self.recipient,
+                'amount': self.amount / AMOUNT_SCALE,
+                'timestamp': self.timestamp,
+                'signature': self.signature.hex()
+            }
+        return self._dict_cache
+
+    def to_json_bytes(self) -> bytes:
+        """JSON-encoded form of to_dict(), computed once."""
+        if self._encoded_cache is None:
+            self._encoded_cache = orjson.dumps(self.to_dict())
+        return self._encoded_cache
         
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'Transaction':
@@ -48,13 +107,21 @@ class Transaction:
             recipient=data['recipient'],
             amount=data['amount'],
             timestamp=data['timestamp'],
-            signature=data['signature']
+            signature=bytes.fromhex(data['signature'])
         )
         
     def calculate_hash(self) -> str:
-        """Calculate a hash of the transaction."""
-        transaction_string = json.dumps(self.to_dict(), sort_keys=True)
-        return SHA256.new(transaction_string.encode()).hexdigest()
+        """Calculate a hash of the transaction.
+
+        Transactions never change after construction, so the hash is
+        computed once and memoized; duplicate detection over the whole
+        chain then costs a string compare per transaction.
+        """
+        if self._hash is None:
+            preimage = (f"{self.sender}|{self.recipient}|{self.amount!r}|{self.timestamp!r}|".encode()
+                        + self.signature)
+            self._hash = SHA256.new(preimage).hexdigest()
+        return self._hash
         
     def __eq__(self, other):
         """Compare transactions by their hash."""
@@ -63,12 +130,16 @@ class Transaction:
         return self.calculate_hash() == other.calculate_hash()
         
     def __repr__(self):
-        return f"Transaction(sender={self.sender}, recipient={self.recipient}, amount={self.amount})"
+        return f"Transaction(sender={self.sender}, recipient={self.recipient}, amount={self.amount / AMOUNT_SCALE})"
 
 
 class Block:
     """Represents a block in the blockchain."""
-    
+
+    __slots__ = ('index', 'transactions', 'timestamp', 'previous_hash',
+                 'nonce', 'difficulty', 'hash', '_digest', '_prefix_bytes',
+                 '_hash_verified', '_dict_cache', '_encoded_cache')
+
     def __init__(self, index: int, transactions: List[Transaction], timestamp: float, 
                  previous_hash: str, nonce: int = 0, difficulty: int = 4):
         """
@@ -88,49 +159,154 @@ class Block:
         self.previous_hash = previous_hash
         self.nonce = nonce
         self.difficulty = difficulty
-        self.hash = self.calculate_hash()
-        
+        self._prefix_bytes = self._build_prefix()
+        # True once this block's stored hash is known to match its
+        # contents (set by local mining or a successful verification);
+        # lets validation skip recomputing digests it has already paid for.
+        self._hash_verified = False
+        # Raw digest kept next to the hex hash so validation can test
+        # difficulty with byte compares instead of re-parsing hex.
+        self._digest = self._calculate_digest()
+        self.hash = self._digest.hex()
+        # Serialization caches; dropped whenever mining rewrites the
+        # nonce/hash so a stale dict can never be broadcast
+        self._dict_cache = None
+        self._encoded_cache = None
+        
+    def _build_prefix(self) -> bytes:
+        """Serialize everything but the nonce, once per block.
+
+        The preimage joins the fixed-schema fields with '|' in a known
+        order — header fields, then each transaction's cached hash —
+        leaving the trailing nonce as the only variable segment.
+        """
+        parts = [str(self.index), repr(self.timestamp), self.previous_hash]
+        parts.extend(t.calculate_hash() for t in self.transactions)
+        return ('|'.join(parts) + '|').encode()
+
+    def _calculate_digest(self) -> bytes:
+        """Calculate the raw SHA-256 digest of the block."""
+        return hashlib.sha256(self._prefix_bytes + b'%d' % self.nonce).digest()
+
     def calculate_hash(self) -> str:
         """Calculate the hash of the block."""
-        block_string = json.dumps({
-            'index': self.index,
-            'transactions': [t.to_dict() for t in self.transactions],
-            'timestamp': self.timestamp,
-            'previous_hash': self.previous_hash,
-            'nonce': self.nonce
-        }, sort_keys=True)
-        
-        return hashlib.sha256(block_string.encode()).hexdigest()
+        return self._calculate_digest().hex()
         
     def mine_block(self) -> None:
         """
         Mine the block by finding a hash with the required difficulty.
         This implements Proof of Work consensus mechanism.
+
+        The canonical preimage ends with the nonce, so everything else
+        is hashed into a SHA-256 midstate exactly once; each attempt
+        copies the midstate and feeds it only the nonce digits. The
+        difficulty test runs on the raw digest nibbles, avoiding a hex
+        string per attempt.
         """
-        target = '0' * self.difficulty
-        
-        while self.hash[:self.difficulty] != target:
-            self.nonce += 1
-            self.hash = self.calculate_hash()
-            
+        prefix = self._prefix_bytes
+        suffix = b''
+
+        if self.difficulty >= self._PARALLEL_DIFFICULTY and (os.cpu_count() or 1) > 1:
+            self.nonce, self._digest = self._mine_parallel(prefix, suffix)
+            self.hash = self._digest.hex()
+            self._hash_verified = True
+            self._dict_cache = None
+            self._encoded_cache = None
+            logger.info(f"Block mined: {self.hash}")
+            return
+
+        base = hashlib.sha256(prefix)
+        zero_bytes, odd_nibble = divmod(self.difficulty, 2)
+        zeros = b'\x00' * zero_bytes
+
+        nonce = self.nonce
+        while True:
+            h = base.copy()
+            h.update(b'%d' % nonce)
+            digest = h.digest()
+            if digest[:zero_bytes] == zeros and (not odd_nibble or digest[zero_bytes] < 16):
+                break
+            nonce += 1
+
+        self.nonce = nonce
+        self._digest = digest
+        self.hash = digest.hex()
+        self._hash_verified = True
+        self._dict_cache = None
+        self._encoded_cache = None
         logger.info(f"Block mined: {self.hash}")
-        
+
+    # Expected attempts grow 16x per difficulty level; below this the
+    # serial loop finishes before worker processes would even start.
+    _PARALLEL_DIFFICULTY = 5
+    _GRIND_CHUNK = 1 << 16
+
+    def _mine_parallel(self, prefix: bytes, suffix: bytes) -> tuple:
+        """Grind the nonce space across CPU cores in disjoint ranges.
+
+        Each worker process searches its own contiguous range, so no two
+        workers ever test the same nonce; the first hit wins and the
+        remaining ranges are cancelled.
+        """
+        workers = os.cpu_count() or 1
+        next_start = self.nonce
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            pending = set()
+            for _ in range(workers):
+                pending.add(pool.submit(
+                    _grind_chunk,
+                    (prefix, suffix, self.difficulty, next_start, self._GRIND_CHUNK)))
+                next_start += self._GRIND_CHUNK
+            while True:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    found = future.result()
+                    if found is not None:
+                        for leftover in pending:
+                            leftover.cancel()
+                        return found
+                    pending.add(pool.submit(
+                        _grind_chunk,
+                        (prefix, suffix, self.difficulty, next_start, self._GRIND_CHUNK)))
+                    next_start += self._GRIND_CHUNK
+        
+    @staticmethod
+    def _meets_difficulty(digest: bytes, difficulty: int) -> bool:
+        """Check leading zero nibbles on a raw digest.
+
+        Comparing digest bytes against a precomputed zero prefix is a
+        single C-level compare; no hex string is built for the test.
+        """
+        zero_bytes, odd_nibble = divmod(difficulty, 2)
+        if digest[:zero_bytes] != b'\x00' * zero_bytes:
+            return False
+        return not odd_nibble or digest[zero_bytes] < 16
+
     def is_hash_valid(self) -> bool:
         """Verify that the block's hash meets the difficulty requirement."""
-        return (self.hash[:self.difficulty] == '0' * self.difficulty and
-                self.hash == self.calculate_hash())
+        if not self._meets_difficulty(self._digest, self.difficulty):
+            return False
+        return self._hash_verified or self.hash == self.calculate_hash()
                 
     def to_dict(self) -> Dict[str, Any]:
-        """Convert the block to a dictionary."""
-        return {
-            'index': self.index,
-            'transactions': [t.to_dict() for t in self.transactions],
-            'timestamp': self.timestamp,
-            'previous_hash': self.previous_hash,
-            'nonce': self.nonce,
-            'difficulty': self.difficulty,
-            'hash': self.hash
-        }
+        """Convert the block to a dictionary (cached once mined)."""
+        if self._dict_cache is None:
+            self._dict_cache = {
+                'index': self.index,
+                'transactions': [t.to_dict() for t in self.transactions],
+                'timestamp': self.timestamp,
+                'previous_hash': self.previous_hash,
+                'nonce': self.nonce,
+                'difficulty': self.difficulty,
+                'hash': self.hash
+            }
+        return self._dict_cache
+
+    def to_json_bytes(self) -> bytes:
+        """JSON-encoded form of to_dict(), computed once per mined block."""
+        if self._encoded_cache is None:
+            self._encoded_cache = orjson.dumps(self.to_dict())
+        return self._encoded_cache
         
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'Block':
@@ -145,6 +321,7 @@ class Block:
             difficulty=data['difficulty']
         )
         block.hash = data['hash']
+        block._digest = bytes.fromhex(data['hash'])
         return block
         
     def __repr__(self):
@@ -163,15 +340,70 @@ class Blockchain:
         """
         # Initialize with genesis block
         self.chain = []
-        self.pending_transactions = []
-        self.rejected_transactions = []
+        self.pending_transactions = deque()
+        # Bounded ring buffer: rejections are diagnostics, so the oldest
+        # entries may fall off instead of growing memory forever.
+        self.rejected_transactions = deque(maxlen=10_000)
         self.difficulty = difficulty
-        self.user_balances = {}  # User -> balance mapping
-        self.mining_reward = 1.0  # Reward for mining a block
+        # Balances in structure-of-arrays form: addresses are interned to
+        # small integer IDs and balances live in one float64 vector, so a
+        # settlement is two array writes instead of dict hashing.
+        self._addr_idx: Dict[str, int] = {}
+        self._balances = np.zeros(0, dtype=np.int64)
+        # Overlay of not-yet-mined balance movement in minor units,
+        # including the starting-balance seed of first-time senders.
+        # Committed balances change only when a block is mined;
+        # validation and reads see committed + overlay.
+        self._pending_deltas: Dict[str, int] = {}
+        # Running count of pending transactions with a real sender, so
+        # the mining-readiness check never rescans the pool.
+        self._nonsystem_pending_count = 0
+        self.mining_reward = 1.0  # Reward for mining a block, in major units
+        # Duplicate-detection indices: every tx hash in the chain or the
+        # pending pool, and (sender, recipient, amount) triples for the
+        # pending pool only. Lookups are O(1) instead of walking the chain.
+        self._tx_hash_index = set()
+        self._pending_party_amounts = set()
+        # Validation checkpoint: blocks before this index have already
+        # passed is_chain_valid, with the balance state they produced.
+        self._validated_up_to = 1
+        self._validated_balances = {}
         
         # Create the genesis block
         self.create_genesis_block()
         
+    @property
+    def user_balances(self) -> Dict[str, float]:
+        """Dict view of all effective balances in major units."""
+        raw = {addr: int(self._balances[i]) for addr, i in self._addr_idx.items()}
+        for addr, delta in self._pending_deltas.items():
+            raw[addr] = raw.get(addr, 0) + delta
+        return {addr: units / AMOUNT_SCALE for addr, units in raw.items()}
+
+    @user_balances.setter
+    def user_balances(self, balances: Dict[str, float]) -> None:
+        self._addr_idx = {}
+        self._balances = np.zeros(0, dtype=np.int64)
+        self._pending_deltas = {}
+        for addr, amount in balances.items():
+            self._addr_id(addr, initial=round(amount * AMOUNT_SCALE))
+
+    def _addr_id(self, address: str, initial: int = 0) -> int:
+        """Intern an address, growing the balance vector as needed.
+
+        ``initial`` is in minor units.
+        """
+        idx = self._addr_idx.get(address)
+        if idx is None:
+            idx = len(self._addr_idx)
+            self._addr_idx[address] = idx
+            if idx >= self._balances.shape[0]:
+                grown = np.zeros(max(16, self._balances.shape[0] * 2), dtype=np.int64)
+                grown[:self._balances.shape[0]] = self._balances
+                self._balances = grown
+            self._balances[idx] = initial
+        return idx
+
     def create_genesis_block(self) -> None:
         """Create the first block in the chain (genesis block)."""
         genesis_block = Block(0, [], time.time(), "0")
@@ -199,61 +431,66 @@ class Blockchain:
             self._reject_transaction(transaction, "Duplicate transaction")
             return False
             
-        # Validate transaction (sufficient funds)
-        if not self._is_transaction_valid(transaction):
+        # Validate transaction (sufficient funds) without touching state
+        if not self._validate_transaction(transaction):
             logger.warning(f"Rejected invalid transaction: {transaction}")
             self._reject_transaction(transaction, "Insufficient funds")
             return False
-            
-        # Add to pending transactions
+
+        # Add to pending transactions and record its balance movement in
+        # the pending overlay; committed balances change at mining time.
         self.pending_transactions.append(transaction)
+        self._record_pending(transaction)
+        self._index_transaction(transaction)
+        if transaction.sender != "0":
+            self._nonsystem_pending_count += 1
         logger.info(f"Transaction added to pool: {transaction}")
         
         # Return True and indicate if we've reached 3 transactions
         # Don't count system transactions (sender="0") in this count
-        non_system_transactions = [tx for tx in self.pending_transactions if tx.sender != "0"]
-        reached_transaction_limit = len(non_system_transactions) >= 3
+        reached_transaction_limit = self._nonsystem_pending_count >= 3
         
-        logger.info(f"Current pending transactions: {len(non_system_transactions)} (non-system)")
+        logger.info(f"Current pending transactions: {self._nonsystem_pending_count} (non-system)")
         if reached_transaction_limit:
             logger.info("Reached 3 pending transactions, ready for mining")
             
         return True
         
     def _is_duplicate_transaction(self, transaction: Transaction) -> bool:
-        """Check if a transaction is a duplicate by comparing transaction hashes."""
-        # Generate hash for this transaction
-        tx_hash = transaction.calculate_hash()
-        
-        # Check pending transactions by hash
-        for tx in self.pending_transactions:
-            if tx.calculate_hash() == tx_hash:
-                logger.info(f"Rejecting duplicate transaction: {transaction}")
-                return True
-                
-        # Check transactions in blockchain by hash
-        for block in self.chain:
-            for tx in block.transactions:
-                if tx.calculate_hash() == tx_hash:
-                    logger.info(f"Rejecting duplicate transaction: already in blockchain")
-                    return True
-                    
-        # Also check for transactions between same parties with same amount
+        """Check if a transaction is a duplicate via the hash indices."""
+        # Exact duplicate anywhere in the chain or pending pool
+        if transaction.calculate_hash() in self._tx_hash_index:
+            logger.info(f"Rejecting duplicate transaction: {transaction}")
+            return True
+
+        # Same parties and amount already pending
         # (common user mistake of clicking submit twice)
-        for tx in self.pending_transactions:
-            if (tx.sender == transaction.sender and 
-                tx.recipient == transaction.recipient and 
-                tx.amount == transaction.amount):
-                # Very likely a duplicate submission
-                logger.info(f"Rejecting likely duplicate transaction between same parties with same amount")
-                return True
-                    
+        if (transaction.sender, transaction.recipient, transaction.amount) in self._pending_party_amounts:
+            logger.info(f"Rejecting likely duplicate transaction between same parties with same amount")
+            return True
+
         return False
+
+    def _index_transaction(self, transaction: Transaction) -> None:
+        """Record a queued transaction in the duplicate-detection indices."""
+        self._tx_hash_index.add(transaction.calculate_hash())
+        self._pending_party_amounts.add(
+            (transaction.sender, transaction.recipient, transaction.amount))
+
+    def _rebuild_tx_indices(self) -> None:
+        """Rebuild both duplicate-detection indices from chain and pending state."""
+        self._tx_hash_index = {
+            tx.calculate_hash() for block in self.chain for tx in block.transactions
+        }
+        self._tx_hash_index.update(tx.calculate_hash() for tx in self.pending_transactions)
+        self._pending_party_amounts = {
+            (tx.sender, tx.recipient, tx.amount) for tx in self.pending_transactions
+        }
         
-    def _is_transaction_valid(self, transaction: Transaction) -> bool:
+    def _validate_transaction(self, transaction: Transaction) -> bool:
         """
-        Validate a transaction.
-        
+        Validate a transaction without mutating any balance state.
+
         A transaction is valid if:
         - It's a mining reward (sender is "0")
         - The sender has sufficient funds (or it's their first transaction, they get 100 initial balance)
@@ -261,33 +498,33 @@ class Blockchain:
         # Mining rewards are always valid
         if transaction.sender == "0":
             return True
-            
-        # Check if sender exists in user_balances
-        if transaction.sender not in self.user_balances:
-            # First transaction for this user - initialize with 100 balance
+
+        return self._available_funds(transaction.sender) >= transaction.amount
+
+    def _available_funds(self, sender: str) -> int:
+        """Effective spendable minor units: committed funds plus pending deltas."""
+        idx = self._addr_idx.get(sender)
+        if idx is not None:
+            return int(self._balances[idx]) + self._pending_deltas.get(sender, 0)
+        if sender in self._pending_deltas:
+            return self._pending_deltas[sender]
+        # First-time sender: the standard starting balance
+        return 100 * AMOUNT_SCALE
+
+    def _record_pending(self, transaction: Transaction) -> None:
+        """Fold an accepted transaction into the pending-delta overlay."""
+        deltas = self._pending_deltas
+        if transaction.sender == "0":
+            deltas[transaction.recipient] = deltas.get(transaction.recipient, 0) + transaction.amount
+            return
+        if transaction.sender not in self._addr_idx and transaction.sender not in deltas:
             logger.info(f"Initializing new user {transaction.sender} with 100 balance")
-            self.user_balances[transaction.sender] = 100.0
-            
-        # Check if recipient exists in user_balances
-        if transaction.recipient not in self.user_balances:
-            # First transaction for this recipient - initialize with 0 balance
+            deltas[transaction.sender] = 100 * AMOUNT_SCALE
+        if transaction.recipient not in self._addr_idx and transaction.recipient not in deltas:
             logger.info(f"Initializing new user {transaction.recipient} with 0 balance")
-            self.user_balances[transaction.recipient] = 0.0
-            
-        # Check if sender has enough funds
-        sender_balance = self.user_balances[transaction.sender]
-        
-        if sender_balance < transaction.amount:
-            self._reject_transaction(transaction, f"Insufficient funds: {sender_balance} < {transaction.amount}")
-            return False
-        
-        # Update balances immediately after validation for real-time balance tracking
-        self.user_balances[transaction.sender] -= transaction.amount
-        self.user_balances[transaction.recipient] += transaction.amount
-        logger.info(f"Updated balance for {transaction.sender}: {self.user_balances[transaction.sender]}")
-        logger.info(f"Updated balance for {transaction.recipient}: {self.user_balances[transaction.recipient]}")
-            
-        return True
+            deltas[transaction.recipient] = 0
+        deltas[transaction.sender] = deltas.get(transaction.sender, 0) - transaction.amount
+        deltas[transaction.recipient] = deltas.get(transaction.recipient, 0) + transaction.amount
         
     def _reject_transaction(self, transaction: Transaction, reason: str) -> None:
         """Add a transaction to the rejected list with reason."""
@@ -314,11 +551,12 @@ class Blockchain:
             amount=self.mining_reward
         )
         self.pending_transactions.append(reward_transaction)
+        self._tx_hash_index.add(reward_transaction.calculate_hash())
         
         # Create a new block
         block = Block(
             index=len(self.chain),
-            transactions=self.pending_transactions,
+            transactions=list(self.pending_transactions),
             timestamp=time.time(),
             previous_hash=self.get_latest_block().hash,
             difficulty=self.difficulty
@@ -333,35 +571,57 @@ class Blockchain:
         # Update balances
         self._update_balances(block)
         
-        # Clear pending transactions
-        self.pending_transactions = []
-        
+        # Clear pending transactions; their hashes stay indexed since the
+        # transactions now live in the chain, but the party-amount pairs
+        # only ever guard the pending pool.
+        self.pending_transactions.clear()
+        self._pending_party_amounts.clear()
+        self._pending_deltas = {}
+        self._nonsystem_pending_count = 0
+
         logger.info(f"Block mined and added to chain: {block}")
         return block
         
     def _update_balances(self, block: Block) -> None:
-        """Update account balances based on a block's transactions."""
-        # Note: Most balance updates happen in real-time during transaction validation
-        # This method is mainly for processing mining rewards and for blockchain reconstruction
-        
+        """Apply a block's transactions to the committed balance vector.
+
+        Validation is pure, so this is the single place balances move:
+        at mining time for local blocks, and during reconstruction when
+        a chain is adopted or deserialized.
+        """
         for transaction in block.transactions:
-            # Skip if sender is 0 (mining reward)
             if transaction.sender == "0":
-                # Only handle mining rewards here
-                if transaction.recipient in self.user_balances:
-                    self.user_balances[transaction.recipient] += transaction.amount
-                    logger.info(f"Mining reward: {transaction.recipient} balance updated to {self.user_balances[transaction.recipient]}")
+                # Mining reward: credit the recipient
+                if transaction.recipient in self._addr_idx:
+                    recipient_id = self._addr_id(transaction.recipient)
+                    self._balances[recipient_id] += transaction.amount
+                    logger.info(f"Mining reward: {transaction.recipient} balance updated to {self._balances[recipient_id]}")
                 else:
-                    self.user_balances[transaction.recipient] = transaction.amount
+                    self._addr_id(transaction.recipient, initial=transaction.amount)
                     logger.info(f"Mining reward: {transaction.recipient} initialized with {transaction.amount}")
-            # Regular transactions are already processed during validation
-            # This handles transactions when reconstructing the blockchain from storage
+                continue
+
+            sender_id = self._addr_id(transaction.sender, initial=100 * AMOUNT_SCALE)
+            recipient_id = self._addr_id(transaction.recipient, initial=0)
+            self._balances[sender_id] -= transaction.amount
+            self._balances[recipient_id] += transaction.amount
             
+    def _rebuild_pending_deltas(self) -> None:
+        """Recompute the pending overlay and counters from the pending pool."""
+        self._pending_deltas = {}
+        self._nonsystem_pending_count = 0
+        for tx in self.pending_transactions:
+            self._record_pending(tx)
+            if tx.sender != "0":
+                self._nonsystem_pending_count += 1
+
     def get_balance(self, address: str) -> float:
-        """Get the current balance for an address."""
-        if address not in self.user_balances:
+        """Get the effective balance for an address in major units."""
+        idx = self._addr_idx.get(address)
+        if idx is None and address not in self._pending_deltas:
             return 0
-        return self.user_balances[address]
+        committed = int(self._balances[idx]) if idx is not None else 0
+        return (committed + self._pending_deltas.get(address, 0)) / AMOUNT_SCALE
         
     def is_chain_valid(self) -> bool:
         """
@@ -379,16 +639,20 @@ class Blockchain:
         # Check if chain is empty or just the genesis block
         if not self.chain or len(self.chain) == 1:
             return True
-            
-        # Start from the second block (index 1) since genesis is always valid
-        temp_user_balances = {}  # Track user balances during validation
-        
-        for i in range(1, len(self.chain)):
+
+        # Resume from the checkpoint left by the previous validation:
+        # blocks are append-only outside replace_chain (which resets the
+        # checkpoint), so only the new tail needs to be walked.
+        start = min(self._validated_up_to, len(self.chain))
+        temp_user_balances = dict(self._validated_balances)
+
+        for i in range(start, len(self.chain)):
             current_block = self.chain[i]
             previous_block = self.chain[i-1]
             
-            # Check hash integrity
-            if current_block.hash != current_block.calculate_hash():
+            # Check hash integrity (already proven for locally-mined or
+            # previously verified blocks)
+            if not current_block._hash_verified and current_block.hash != current_block.calculate_hash():
                 logger.warning(f"Invalid hash in block {i}")
                 return False
                 
@@ -404,32 +668,47 @@ class Blockchain:
                 
             # Verify each transaction
             for tx in current_block.transactions:
-                # Initialize balances for new users with proper starting amounts
-                if tx.sender not in temp_user_balances and tx.sender != "0":
-                    # New senders start with 100 balance
-                    temp_user_balances[tx.sender] = 100.0
-                    
-                if tx.recipient not in temp_user_balances:
-                    # New recipients start with 0 balance
-                    temp_user_balances[tx.recipient] = 0.0
-                
-                # Skip mining rewards
-                if tx.sender == "0":
-                    # Just add the mining reward to recipient
-                    temp_user_balances[tx.recipient] += tx.amount
-                    continue
-                    
-                # Check if sender has enough funds
-                if temp_user_balances[tx.sender] < tx.amount:
+                if not self._settle_for_validation(tx, temp_user_balances):
                     logger.warning(f"Invalid chain: Transaction in block {i} has insufficient funds")
                     return False
-                    
-                # Update temporary balances
-                temp_user_balances[tx.sender] -= tx.amount
-                temp_user_balances[tx.recipient] += tx.amount
-                
+
+        self._validated_up_to = len(self.chain)
+        self._validated_balances = temp_user_balances
         return True
         
+    @staticmethod
+    def _settle_for_validation(tx: Transaction, balances: Dict[str, int]) -> bool:
+        """Apply one transaction to a validation balance sheet.
+
+        Seeds first-seen parties with the standard starting amounts,
+        credits mining rewards, and returns False when the sender lacks
+        the funds. Shared by is_chain_valid and replace_chain.
+        """
+        # Initialize balances for new users with proper starting amounts
+        if tx.sender not in balances and tx.sender != "0":
+            # New senders start with 100 balance
+            balances[tx.sender] = 100 * AMOUNT_SCALE
+
+        if tx.recipient not in balances:
+            # New recipients start with 0 balance
+            balances[tx.recipient] = 0
+
+        # Mining rewards just credit the recipient
+        if tx.sender == "0":
+            balances[tx.recipient] += tx.amount
+            return True
+
+        if balances[tx.sender] < tx.amount:
+            return False
+
+        balances[tx.sender] -= tx.amount
+        balances[tx.recipient] += tx.amount
+        return True
+
+    # Candidate chains shorter than this are verified serially; process
+    # startup costs more than the hashing below it.
+    _PARALLEL_VERIFY_MIN = 64
+
     def replace_chain(self, new_chain: List[Dict[str, Any]]) -> bool:
         """
         Replace the chain with a new one if it's longer and valid.
@@ -449,13 +728,33 @@ class Blockchain:
             logger.info("Received chain is not longer than current chain")
             return False
             
-        # Validate the new chain
-        temp_blockchain = Blockchain()
-        temp_blockchain.chain = blocks
-        
-        if not temp_blockchain.is_chain_valid():
+        # Validate the new chain: previous-hash links are inherently
+        # sequential, but each block's hash integrity and proof-of-work
+        # depend only on that block, so those checks fan out across
+        # cores for long chains.
+        for i in range(1, len(blocks)):
+            if blocks[i].previous_hash != blocks[i - 1].hash:
+                logger.warning("Received chain is invalid")
+                return False
+
+        body = blocks[1:]
+        if len(body) >= self._PARALLEL_VERIFY_MIN:
+            with ProcessPoolExecutor() as pool:
+                hashes_ok = all(pool.map(_verify_block, body, chunksize=16))
+        else:
+            hashes_ok = all(_verify_block(block) for block in body)
+        if not hashes_ok:
             logger.warning("Received chain is invalid")
             return False
+        for block in body:
+            block._hash_verified = True
+
+        validation_balances = {}
+        for block in body:
+            for tx in block.transactions:
+                if not self._settle_for_validation(tx, validation_balances):
+                    logger.warning("Received chain is invalid")
+                    return False
             
         # Store the current pending transactions
         original_pending = self.pending_transactions.copy()
@@ -468,26 +767,29 @@ class Blockchain:
         for block in self.chain:
             self._update_balances(block)
             
-        # Clean pending transactions - remove any that are already in the new chain
-        all_transactions_in_chain = []
-        for block in self.chain:
-            all_transactions_in_chain.extend(block.transactions)
-            
-        # Create sets of transaction identifiers in the chain
-        tx_hashes_in_chain = {tx.calculate_hash() for tx in all_transactions_in_chain}
-        tx_details_in_chain = {(tx.sender, tx.recipient, tx.amount) for tx in all_transactions_in_chain}
+        # Clean pending transactions - remove any that are already in the
+        # new chain. Transaction hashes are memoized, so building these
+        # sets hashes each transaction at most once and never re-hashes
+        # when filtering below.
+        chain_transactions = [tx for block in self.chain for tx in block.transactions]
+        tx_hashes_in_chain = {tx.calculate_hash() for tx in chain_transactions}
+        tx_details_in_chain = {(tx.sender, tx.recipient, tx.amount) for tx in chain_transactions}
         
         # Filter pending transactions to keep only those not in the chain
-        self.pending_transactions = [
+        self.pending_transactions = deque(
             tx for tx in original_pending
-            if (tx.calculate_hash() not in tx_hashes_in_chain and 
+            if (tx.calculate_hash() not in tx_hashes_in_chain and
                 (tx.sender, tx.recipient, tx.amount) not in tx_details_in_chain)
-        ]
+        )
         
         removed_count = len(original_pending) - len(self.pending_transactions)
         if removed_count > 0:
             logger.info(f"Removed {removed_count} transactions from pending pool that were already in the new chain")
-            
+
+        self._rebuild_tx_indices()
+        self._rebuild_pending_deltas()
+        self._validated_up_to = 1
+        self._validated_balances = {}
         logger.info("Blockchain replaced with a longer valid chain")
         return True
         
@@ -504,14 +806,16 @@ class Blockchain:
         """Create a Blockchain object from a dictionary."""
         blockchain = cls(difficulty=data['difficulty'])
         blockchain.chain = [Block.from_dict(block_data) for block_data in data['chain']]
-        blockchain.pending_transactions = [Transaction.from_dict(tx_data) 
-                                          for tx_data in data['pending_transactions']]
+        blockchain.pending_transactions = deque(
+            Transaction.from_dict(tx_data) for tx_data in data['pending_transactions'])
+        blockchain._rebuild_pending_deltas()
         
         # Recalculate user balances
         blockchain.user_balances = {}
         for block in blockchain.chain:
             blockchain._update_balances(block)
-            
+
+        blockchain._rebuild_tx_indices()
         return blockchain
         
     def get_transactions_for_address(self, address: str) -> List[Dict[str, Any]]:
@@ -532,4 +836,4 @@ class Blockchain:
         
     def get_rejected_transactions(self) -> List[Dict[str, Any]]:
         """Get all rejected transactions."""
-        return self.rejected_transactions
+        return list(self.rejected_transactions)
@@ -1,18 +1,97 @@
 import argparse
+import functools
 import json
+import os
+import shlex
+from dataclasses import dataclass, fields
 import sys
 import time
 import logging
 import requests
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from typing import Dict, Any, List, Optional
 import uuid
 
 from blockchain import Transaction
 
-# Configure logging
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+# prompt_toolkit gives the REPL history and tab completion without
+# Python-level readline hooks; plain input() remains the fallback.
+try:
+    from prompt_toolkit import PromptSession
+    from prompt_toolkit.completion import WordCompleter
+    from prompt_toolkit.history import FileHistory
+    _HAS_PROMPT_TOOLKIT = True
+except ImportError:
+    _HAS_PROMPT_TOOLKIT = False
+
+# orjson decodes straight from bytes several times faster than stdlib
+# json — noticeable on full-chain dumps — but the CLI still works
+# without it.
+try:
+    import orjson
+    _loads = orjson.loads
+    _dumps = orjson.dumps
+except ImportError:
+    _loads = json.loads
+    def _dumps(obj):
+        return json.dumps(obj).encode()
+
+# ijson lets show_chain decode and print blocks while the body is still
+# downloading, keeping peak memory at one block instead of the whole
+# chain; without it the chain is buffered as before.
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# Configure logging. The CLI is an interactive tool, so info-level
+# chatter is off and the format skips the per-record strftime an
+# asctime field would force.
+logging.basicConfig(level=logging.WARNING, format='%(levelname)s %(message)s')
 logger = logging.getLogger('cli')
 
+# Blocks and transactions mined in the same second share a timestamp;
+# memoizing ctime skips the repeated strftime work in display loops.
+_ctime = functools.lru_cache(maxsize=4096)(time.ctime)
+
+# With BCLI_FAST_OUT=1, bulk listings bypass the TextIOWrapper encoder
+# and its lock by writing pre-encoded bytes straight to the buffer.
+# Off by default for terminals where the text layer matters (Windows).
+_FAST_OUT = os.environ.get('BCLI_FAST_OUT') == '1'
+
+
+def _write_out(text: str) -> None:
+    """Write a bulk listing to stdout in one call."""
+    if _FAST_OUT:
+        sys.stdout.buffer.write(text.encode('utf-8'))
+        sys.stdout.flush()
+    else:
+        sys.stdout.write(text)
+
+
+@dataclass(slots=True)
+class NodeInfo:
+    """Typed view of /nodes/info: slot attribute reads instead of a
+    dict .get() per displayed field."""
+    address: str = 'Unknown'
+    host: str = 'Unknown'
+    port: Any = 'Unknown'
+    node_type: str = 'Unknown'
+    registered_nodes: int = 0
+    active_nodes: int = 0
+    chain_length: int = 0
+    pending_transactions: int = 0
+    is_mining: bool = False
+    miner_mode: bool = False
+
+
+def _parse(cls, data: Dict[str, Any]):
+    """Build a response dataclass, ignoring unknown keys and keeping
+    the field defaults for missing ones."""
+    return cls(**{f.name: data[f.name] for f in fields(cls) if f.name in data})
+
 class BlockchainCLI:
     """Command-line interface for the blockchain network."""
     
@@ -24,9 +103,32 @@ class BlockchainCLI:
             node_address: The address of the node to connect to (http://host:port)
         """
         self.node_address = node_address
+        self._timeout = 10.0
+        self._running = True
+        # One keep-alive session for the whole CLI run: every command
+        # hits the same node, so reusing the pooled socket skips a TCP
+        # handshake per request.
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16,
+                              max_retries=Retry(total=2, backoff_factor=0.1))
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        # Last /chain payload, kept so 'block <idx>' can answer from
+        # data already on hand instead of another round trip. Cleared
+        # by any command that can change the chain, and expired by age
+        # since the chain can also grow server-side (peer broadcasts,
+        # background mining, node-side consensus) without the CLI
+        # issuing any command.
+        self._chain_cache = None
+        self._chain_cache_ts = 0.0
+        self._chain_cache_ttl = 10.0
+        # Small pool for commands that fan out several independent
+        # requests (dashboard); sized to the session's connection pool.
+        self._pool = ThreadPoolExecutor(max_workers=4)
         self.commands = {
             'help': self.show_help,
             'info': self.show_node_info,
+            'dashboard': self.show_dashboard,
             'chain': self.show_chain,
             'validate': self.validate_chain,
             'balance': self.show_balance,
@@ -45,7 +147,79 @@ class BlockchainCLI:
             'history': self.show_transaction_history,
             'exit': self.exit_cli
         }
+        # Flat dispatch table: nested subcommands become literal
+        # 'mining start'-style keys, so process_command resolves any
+        # command with at most two dict probes and no isinstance branch.
+        # Keys are interned so the per-command dict probe can
+        # short-circuit on pointer identity instead of comparing
+        # characters.
+        self._flat = {}
+        for name, handler in self.commands.items():
+            if isinstance(handler, dict):
+                for sub, fn in handler.items():
+                    self._flat[sys.intern(f"{name} {sub}")] = fn
+            else:
+                self._flat[sys.intern(name)] = handler
+        # Typed grammar for the REPL, built once: each command is a
+        # subparser with typed positionals, so argument validation and
+        # conversion happen in argparse instead of ad-hoc try/except in
+        # every handler.
+        self._arg_spec = {
+            'balance': [('address', str)],
+            'transaction': [('sender', str), ('recipient', str), ('amount', float)],
+            'register': [('url', str)],
+            'block': [('index', int)],
+            'history': [('address', str)],
+        }
+        self._parser = argparse.ArgumentParser(prog='', add_help=False,
+                                               exit_on_error=False)
+        subparsers = self._parser.add_subparsers(dest='cmd')
+        for name in self.commands:
+            command_parser = subparsers.add_parser(name, add_help=False)
+            if name == 'mining':
+                command_parser.add_argument('action', choices=('start', 'stop'))
+            else:
+                for arg_name, arg_type in self._arg_spec.get(name, ()):
+                    command_parser.add_argument(arg_name, type=arg_type)
+        if _HAS_PROMPT_TOOLKIT:
+            self._prompt_session = PromptSession(
+                completer=WordCompleter(list(self.commands.keys())),
+                history=FileHistory('.bcli_history'))
+        else:
+            self._prompt_session = None
         
+    def _invalidate_chain_cache(self) -> None:
+        """Drop the cached chain after a command that may mutate it."""
+        self._chain_cache = None
+
+    def _cached_block(self, index: int) -> Optional[Dict[str, Any]]:
+        """Return a block from the cached chain, if it is fresh enough."""
+        if time.monotonic() - self._chain_cache_ts >= self._chain_cache_ttl:
+            self._chain_cache = None
+        if self._chain_cache is not None and 0 <= index < len(self._chain_cache):
+            block = self._chain_cache[index]
+            if block.get('index') == index:
+                return block
+        return None
+
+    def _stream_chain(self):
+        """Yield blocks from /chain incrementally, or None if unavailable.
+
+        Streams the response body and parses 'chain' items as they
+        arrive, so network, decode and printing overlap and peak memory
+        stays at one block regardless of chain length.
+        """
+        if ijson is None:
+            return None
+        url = f"{self.node_address}/chain"
+        try:
+            response = self.session.get(url, stream=True, timeout=self._timeout)
+            response.raise_for_status()
+        except requests.exceptions.RequestException as e:
+            logger.error(f"Request failed: {e}")
+            return None
+        return ijson.items(response.raw, 'chain.item')
+
     def _make_request(self, endpoint: str, method: str = 'GET', 
                      data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
@@ -63,13 +237,16 @@ class BlockchainCLI:
         
         try:
             if method == 'GET':
-                response = requests.get(url)
+                response = self.session.get(url, timeout=self._timeout)
             elif method == 'POST':
-                response = requests.post(url, json=data)
+                response = self.session.post(
+                    url, data=_dumps(data),
+                    headers={'Content-Type': 'application/json'},
+                    timeout=self._timeout)
             else:
                 raise ValueError(f"Unsupported HTTP method: {method}")
                 
-            return response.json()
+            return _loads(response.content)
             
         except requests.exceptions.RequestException as e:
             logger.error(f"Request failed: {e}")
@@ -81,6 +258,7 @@ class BlockchainCLI:
         print("------------------")
         print("help                   - Show this help message")
         print("info                   - Show node information")
+        print("dashboard              - Show node info, peers and pending at once")
         print("chain                  - Show the blockchain")
         print("validate               - Validate the blockchain")
         print("balance <address>      - Show balance for an address")
@@ -104,21 +282,82 @@ class BlockchainCLI:
             print(f"Error: {response['error']}")
             return
             
+        info = _parse(NodeInfo, response)
         print("\nNode Information:")
         print("-----------------")
-        print(f"Address: {response.get('address', 'Unknown')}")
-        print(f"Host: {response.get('host', 'Unknown')}")
-        print(f"Port: {response.get('port', 'Unknown')}")
-        print(f"Node Type: {response.get('node_type', 'Unknown').upper()}")
-        print(f"Registered Nodes: {response.get('registered_nodes', 0)}")
-        print(f"Active Nodes: {response.get('active_nodes', 0)}")
-        print(f"Chain Length: {response.get('chain_length', 0)}")
-        print(f"Pending Transactions: {response.get('pending_transactions', 0)}")
-        print(f"Mining Status: {'Running' if response.get('is_mining', False) else 'Stopped'}")
-        print(f"Mining Mode: {'Enabled' if response.get('miner_mode', False) else 'Disabled'}")
-        
+        print(f"Address: {info.address}")
+        print(f"Host: {info.host}")
+        print(f"Port: {info.port}")
+        print(f"Node Type: {info.node_type.upper()}")
+        print(f"Registered Nodes: {info.registered_nodes}")
+        print(f"Active Nodes: {info.active_nodes}")
+        print(f"Chain Length: {info.chain_length}")
+        print(f"Pending Transactions: {info.pending_transactions}")
+        print(f"Mining Status: {'Running' if info.is_mining else 'Stopped'}")
+        print(f"Mining Mode: {'Enabled' if info.miner_mode else 'Disabled'}")
+        
+    def show_dashboard(self, *args) -> None:
+        """Show node info, peers and pending transactions in one go.
+
+        The three endpoints are independent, so the requests run
+        concurrently and the sections print in a fixed order once all
+        replies are in — one round trip of wall time instead of three.
+        """
+        futures = [self._pool.submit(self._make_request, endpoint)
+                   for endpoint in ('nodes/info', 'nodes/peers', 'transactions/pending')]
+        info, peers, pending = [f.result() for f in futures]
+
+        print("\nDashboard")
+        print("=========")
+
+        if 'error' in info:
+            print(f"Node info error: {info['error']}")
+        else:
+            print(f"Node: {info.get('address', 'Unknown')} "
+                  f"({info.get('node_type', 'unknown').upper()})")
+            print(f"Chain Length: {info.get('chain_length', 0)}")
+            print(f"Mining: {'Running' if info.get('is_mining', False) else 'Stopped'}")
+
+        if 'error' in peers:
+            print(f"Peers error: {peers['error']}")
+        else:
+            print(f"Peers: {peers.get('total_count', 0)} "
+                  f"(Active: {peers.get('active_count', 0)})")
+
+        if 'error' in pending:
+            print(f"Pending error: {pending['error']}")
+        else:
+            print(f"Pending Transactions: {pending.get('count', 0)}")
+
+    @staticmethod
+    def _format_block(block: Dict[str, Any]) -> str:
+        # float() also normalizes the Decimal timestamps ijson yields
+        when = _ctime(float(block['timestamp']))
+        return (
+            f"Block #{block['index']}\n"
+            f"  Hash: {block['hash'][:16]}...\n"
+            f"  Previous Hash: {block['previous_hash'][:16]}...\n"
+            f"  Timestamp: {when}\n"
+            f"  Transactions: {len(block['transactions'])}\n"
+            f"  Nonce: {block['nonce']}\n")
+
     def show_chain(self, *args) -> None:
         """Show the full blockchain."""
+        blocks = self._stream_chain()
+        if blocks is not None:
+            # Print as blocks arrive: visible progress on long chains
+            # and no full-chain buffer in memory.
+            chain = []
+            print("\nBlockchain")
+            print("--------------------")
+            for block in blocks:
+                chain.append(block)
+                _write_out(self._format_block(block) + "\n")
+            print(f"Blockchain Length: {len(chain)}")
+            self._chain_cache = chain
+            self._chain_cache_ts = time.monotonic()
+            return
+
         response = self._make_request('chain')
         if 'error' in response:
             print(f"Error: {response['error']}")
@@ -126,18 +365,14 @@ class BlockchainCLI:
             
         chain = response.get('chain', [])
         length = response.get('length', 0)
+        self._chain_cache = chain
+        self._chain_cache_ts = time.monotonic()
         
-        print(f"\nBlockchain Length: {length}")
-        print("--------------------")
-        
-        for i, block in enumerate(chain):
-            print(f"Block #{block['index']}")
-            print(f"  Hash: {block['hash'][:16]}...")
-            print(f"  Previous Hash: {block['previous_hash'][:16]}...")
-            print(f"  Timestamp: {time.ctime(block['timestamp'])}")
-            print(f"  Transactions: {len(block['transactions'])}")
-            print(f"  Nonce: {block['nonce']}")
-            print()
+        # Build the whole listing in memory and write it once: one
+        # stdout syscall instead of several per block.
+        out = [f"\nBlockchain Length: {length}", "--------------------"]
+        out.extend(self._format_block(block) for block in chain)
+        _write_out("\n".join(out) + "\n")
             
     def validate_chain(self, *args) -> None:
         """Validate the blockchain."""
@@ -194,6 +429,7 @@ class BlockchainCLI:
         }
         
         response = self._make_request('transactions/new', method='POST', data=transaction)
+        self._invalidate_chain_cache()
         
         if 'error' in response:
             print(f"Error: {response['error']}")
@@ -211,16 +447,16 @@ class BlockchainCLI:
         transactions = response.get('transactions', [])
         count = response.get('count', 0)
         
-        print(f"\nPending Transactions: {count}")
-        print("----------------------")
-        
+        out = [f"\nPending Transactions: {count}", "----------------------"]
         for i, tx in enumerate(transactions):
-            print(f"Transaction #{i+1}")
-            print(f"  From: {tx['sender']}")
-            print(f"  To: {tx['recipient']}")
-            print(f"  Amount: {tx['amount']}")
-            print(f"  Timestamp: {time.ctime(tx['timestamp'])}")
-            print()
+            when = _ctime(tx['timestamp'])
+            out.append(
+                f"Transaction #{i+1}\n"
+                f"  From: {tx['sender']}\n"
+                f"  To: {tx['recipient']}\n"
+                f"  Amount: {tx['amount']}\n"
+                f"  Timestamp: {when}\n")
+        _write_out("\n".join(out) + "\n")
             
     def show_rejected_transactions(self, *args) -> None:
         """Show rejected transactions."""
@@ -232,23 +468,21 @@ class BlockchainCLI:
         transactions = response.get('transactions', [])
         count = response.get('count', 0)
         
-        print(f"\nRejected Transactions: {count}")
-        print("-----------------------")
-        
+        out = [f"\nRejected Transactions: {count}", "-----------------------"]
         for i, item in enumerate(transactions):
             tx = item['transaction']
-            reason = item['reason']
-            
-            print(f"Transaction #{i+1}")
-            print(f"  From: {tx['sender']}")
-            print(f"  To: {tx['recipient']}")
-            print(f"  Amount: {tx['amount']}")
-            print(f"  Reason: {reason}")
-            print()
+            out.append(
+                f"Transaction #{i+1}\n"
+                f"  From: {tx['sender']}\n"
+                f"  To: {tx['recipient']}\n"
+                f"  Amount: {tx['amount']}\n"
+                f"  Reason: {item['reason']}\n")
+        _write_out("\n".join(out) + "\n")
             
     def mine_block(self, *args) -> None:
         """Mine a new block."""
         response = self._make_request('mine')
+        self._invalidate_chain_cache()
         if 'error' in response:
             print(f"Error: {response['error']}")
             return
@@ -265,6 +499,8 @@ class BlockchainCLI:
     def start_mining(self, *args) -> None:
         """Start continuous mining."""
         response = self._make_request('mine/start')
+        # The miner now appends blocks in the background
+        self._invalidate_chain_cache()
         if 'error' in response:
             print(f"Error: {response['error']}")
             return
@@ -304,35 +540,22 @@ class BlockchainCLI:
             print("Example: register http://localhost:5001")
             return
         
+        # Partition and preformat in a single pass over the node table
+        actives, inactives = [], []
+        for i, node in enumerate(nodes):
+            line = (f"{i+1}. {node.get('name', 'Unnamed Node')} - "
+                    f"{node.get('url', 'Unknown URL')}")
+            (actives if node.get('active', False) else inactives).append(line)
+
         # Display active nodes first
         print("\nACTIVE NODES:")
         print("------------")
-        active_found = False
-        
-        for i, node in enumerate(nodes):
-            if node.get('active', False):
-                active_found = True
-                name = node.get('name', 'Unnamed Node')
-                url = node.get('url', 'Unknown URL')
-                print(f"{i+1}. {name} - {url}")
-                
-        if not active_found:
-            print("No active nodes found.")
-            
+        print("\n".join(actives) if actives else "No active nodes found.")
+
         # Display inactive nodes
         print("\nINACTIVE NODES:")
         print("-------------")
-        inactive_found = False
-        
-        for i, node in enumerate(nodes):
-            if not node.get('active', False):
-                inactive_found = True
-                name = node.get('name', 'Unnamed Node')
-                url = node.get('url', 'Unknown URL')
-                print(f"{i+1}. {name} - {url}")
-                
-        if not inactive_found:
-            print("No inactive nodes found.")
+        print("\n".join(inactives) if inactives else "No inactive nodes found.")
             
         print("\nCommands:")
         print("  - 'register <url>' to add a new node")
@@ -357,6 +580,7 @@ class BlockchainCLI:
     def run_consensus(self, *args) -> None:
         """Run the consensus algorithm."""
         response = self._make_request('nodes/resolve')
+        self._invalidate_chain_cache()
         if 'error' in response:
             print(f"Error: {response['error']}")
             return
@@ -365,7 +589,9 @@ class BlockchainCLI:
         
     def show_block(self, *args) -> None:
         """Show details for a specific block."""
-        if not args or not args[0]:
+        # Presence check, not truthiness: argparse passes the index as
+        # an int and the genesis block's 0 is falsy
+        if not args or args[0] is None:
             print("Error: Block index required")
             print("Usage: block <index>")
             return
@@ -376,7 +602,9 @@ class BlockchainCLI:
             print("Error: Index must be a number")
             return
             
-        response = self._make_request(f'blocks/{index}')
+        response = self._cached_block(index)
+        if response is None:
+            response = self._make_request(f'blocks/{index}')
         
         if 'error' in response or 'message' in response and response.get('message') == 'Block not found':
             print(f"Error: Block not found")
@@ -386,7 +614,8 @@ class BlockchainCLI:
         print("-------------")
         print(f"Hash: {response['hash']}")
         print(f"Previous Hash: {response['previous_hash']}")
-        print(f"Timestamp: {time.ctime(response['timestamp'])}")
+        # float() also normalizes the Decimal timestamps ijson yields
+        print(f"Timestamp: {_ctime(float(response['timestamp']))}")
         print(f"Nonce: {response['nonce']}")
         print(f"Difficulty: {response['difficulty']}")
         print(f"Transactions: {len(response['transactions'])}")
@@ -413,25 +642,34 @@ class BlockchainCLI:
         transactions = response.get('transactions', [])
         count = response.get('count', 0)
         
-        print(f"\nTransaction History for {address}: {count} transactions")
-        print("--------------------------------------------------")
-        
+        out = [f"\nTransaction History for {address}: {count} transactions",
+               "--------------------------------------------------"]
         for i, item in enumerate(transactions):
             tx = item['transaction']
             block_index = item['block_index']
             
             # Determine if this address is sender or recipient
-            is_sender = tx['sender'] == address
-            
-            if is_sender:
-                print(f"{i+1}. SENT {tx['amount']} to {tx['recipient']} (Block #{block_index})")
+            if tx['sender'] == address:
+                out.append(f"{i+1}. SENT {tx['amount']} to {tx['recipient']} (Block #{block_index})")
             else:
-                print(f"{i+1}. RECEIVED {tx['amount']} from {tx['sender']} (Block #{block_index})")
+                out.append(f"{i+1}. RECEIVED {tx['amount']} from {tx['sender']} (Block #{block_index})")
+        _write_out("\n".join(out) + "\n")
                 
+    def close(self) -> None:
+        """Release the HTTP connection pool and worker threads."""
+        self._pool.shutdown(wait=False)
+        self.session.close()
+
     def exit_cli(self, *args) -> None:
-        """Exit the CLI."""
+        """Exit the CLI.
+
+        Stops the interactive loop and closes the session explicitly so
+        pooled sockets shut down cleanly, rather than raising SystemExit
+        through the REPL and leaving teardown to interpreter finalization.
+        """
         print("\nExiting blockchain CLI...")
-        sys.exit(0)
+        self._running = False
+        self.close()
         
     def process_command(self, command_line: str) -> None:
         """
@@ -440,23 +678,30 @@ class BlockchainCLI:
         Args:
             command_line: The command line string to process
         """
-        parts = command_line.strip().split()
+        try:
+            parts = shlex.split(command_line)
+        except ValueError as e:
+            print(f"Error: {e}")
+            return
         if not parts:
             return
             
-        command = parts[0].lower()
-        args = parts[1:]
+        parts[0] = parts[0].lower()
+        if parts[0] == 'mining' and len(parts) > 1:
+            parts[1] = parts[1].lower()
         
-        if command in self.commands:
-            # Handle nested commands like 'mining start'
-            if isinstance(self.commands[command], dict) and args and args[0] in self.commands[command]:
-                self.commands[command][args[0]](*args[1:])
-            elif callable(self.commands[command]):
-                self.commands[command](*args)
-            else:
-                print(f"Unknown subcommand: {command} {args[0] if args else ''}")
+        try:
+            ns = self._parser.parse_args(parts)
+        except (argparse.ArgumentError, SystemExit):
+            print(f"Unknown or malformed command: {command_line}")
+            print("Type 'help' for available commands")
+            return
+        
+        if ns.cmd == 'mining':
+            self._flat[sys.intern(f"mining {ns.action}")]()
         else:
-            print(f"Unknown command: {command}")
+            handler = self._flat[sys.intern(ns.cmd)]
+            handler(*(getattr(ns, name) for name, _ in self._arg_spec.get(ns.cmd, ())))
             
     def run_interactive(self) -> None:
         """Run the CLI in interactive mode."""
@@ -465,10 +710,15 @@ class BlockchainCLI:
         print("Type 'help' for available commands")
         print("Type 'exit' to quit")
         
-        while True:
+        while self._running:
             try:
-                command_line = input("\n> ")
-                self.process_command(command_line)
+                if self._prompt_session is not None:
+                    command_line = self._prompt_session.prompt('\n> ').rstrip()
+                else:
+                    command_line = input("\n> ").rstrip()
+                # Blank lines never reach the tokenizer
+                if command_line:
+                    self.process_command(command_line)
             except KeyboardInterrupt:
                 print("\nExiting...")
                 break
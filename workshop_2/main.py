@@ -5,8 +5,11 @@ import logging
 import sys
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Optional
 
+import requests
+
 from blockchain import Blockchain
 from node import Node
 from api import BlockchainAPI
@@ -49,9 +52,46 @@ def parse_args():
     return args
 
 def start_api_server(node: Node, host: str, port: int, debug: bool = False) -> None:
-    """Start the API server."""
+    """Start the API server.
+
+    Debug runs keep Flask's dev server for the reloader and debugger;
+    otherwise waitress serves the app with a thread pool, so requests
+    from several CLI sessions are handled concurrently instead of
+    serializing behind the dev server's single loop.
+    """
     api = BlockchainAPI(node)
-    api.start(host, port, debug)
+    if debug:
+        api.start(host, port, debug)
+        return
+    try:
+        from waitress import serve
+    except ImportError:
+        logger.warning("waitress not installed; falling back to the Flask dev server")
+        api.start(host, port, debug)
+        return
+    logger.info(f"Starting API server (waitress) on {host}:{port}")
+    serve(api.app, host=host, port=port, threads=8,
+          connection_limit=200, channel_timeout=120)
+
+def _wait_for_api(node_address: str, timeout: float = 5.0) -> bool:
+    """Poll the API until it answers, instead of sleeping a fixed second.
+
+    Returns as soon as /nodes/info responds, so the CLI starts at
+    actual readiness (typically well under 100 ms) rather than after a
+    worst-case delay.
+    """
+    deadline = time.monotonic() + timeout
+    with requests.Session() as session:
+        while time.monotonic() < deadline:
+            try:
+                response = session.get(f"{node_address}/nodes/info", timeout=0.1)
+                if response.ok:
+                    return True
+            except requests.exceptions.RequestException:
+                pass
+            time.sleep(0.02)
+    return False
+
 
 def start_cli(node_address: str) -> None:
     """Start the CLI interface."""
@@ -62,6 +102,9 @@ def main():
     """Main entry point."""
     args = parse_args()
     
+    # Debug runs get the verbose trace; normal runs stay at INFO
+    logging.getLogger().setLevel(logging.DEBUG if args.debug else logging.INFO)
+    
     try:
         # Create the blockchain
         blockchain = Blockchain(difficulty=args.difficulty)
@@ -79,14 +122,24 @@ def main():
             external_ip=args.external_ip  # Pass the external IP if specified
         )
         
-        # Connect to peers if specified
+        # Connect to peers if specified. Each registration is a blocking
+        # HTTP round trip, so fan them out and let the slowest peer set
+        # the startup time instead of the sum of them.
         if args.peers:
-            for peer in args.peers:
-                success = node.register_with_node(peer)
-                if success:
-                    logger.info(f"Connected to peer: {peer}")
-                else:
-                    logger.warning(f"Failed to connect to peer: {peer}")
+            with ThreadPoolExecutor(max_workers=min(32, len(args.peers))) as executor:
+                futures = {executor.submit(node.register_with_node, peer): peer
+                           for peer in args.peers}
+                for future in as_completed(futures):
+                    peer = futures[future]
+                    try:
+                        success = future.result()
+                    except Exception as e:
+                        logger.warning(f"Failed to connect to peer: {peer} ({e})")
+                        continue
+                    if success:
+                        logger.info(f"Connected to peer: {peer}")
+                    else:
+                        logger.warning(f"Failed to connect to peer: {peer}")
         
         # Announce this node to all registered peers
         logger.info("Announcing this node to the network...")
@@ -115,8 +168,9 @@ def main():
             api_thread.daemon = True
             api_thread.start()
             
-            # Give API time to start
-            time.sleep(1)
+            # Wait until the API actually answers
+            if not _wait_for_api(node_address):
+                logger.warning("API server did not come up within 5s; starting CLI anyway")
             
             # Start CLI
             logger.info(f"Starting CLI connected to {node_address}")
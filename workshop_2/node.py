@@ -1,12 +1,28 @@
-import json
+import orjson
 import requests
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from requests.adapters import HTTPAdapter
+
+# msgpack peer wire format: smaller payloads and much faster
+# encode/decode than JSON for broadcast objects. Peers that don't
+# accept it answer 415 and get the JSON body instead.
+try:
+    import msgspec.msgpack
+    _MSGPACK_ENCODE = msgspec.msgpack.Encoder().encode
+except ImportError:
+    _MSGPACK_ENCODE = None
+import functools
+import re
 import time
 import threading
 import logging
 import os
 import uuid
 from typing import List, Dict, Any, Set, Optional, Tuple
-from urllib.parse import urlparse
+
+from collections import deque
+
+import numpy as np
 
 from blockchain import Blockchain, Block, Transaction
 
@@ -14,6 +30,20 @@ from blockchain import Blockchain, Block, Transaction
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger('node')
 
+# Peer URLs only ever look like http://host[:port][/]; a compiled regex
+# is much cheaper than a full urlparse() for that shape, and the small
+# cache makes repeated lookups of the same peer free.
+_URL_RE = re.compile(r'^https?://([^:/]+)(?::(\d+))?/?')
+
+
+@functools.lru_cache(maxsize=256)
+def _split_url(node_url: str) -> Tuple[Optional[str], str]:
+    """Split a node URL into (host, port_str); host is None if malformed."""
+    m = _URL_RE.match(node_url)
+    if not m:
+        return None, '80'
+    return m.group(1), m.group(2) or '80'
+
 class Node:
     """
     Blockchain network node that handles peer discovery, 
@@ -36,9 +66,21 @@ class Node:
             status_cache_time: How long (in seconds) to cache node status before rechecking
             external_ip: The public/external IP address of this node (used for identification)
         """
+        # Pooled keep-alive session for all peer HTTP traffic: repeated
+        # calls to the same peer reuse the socket instead of paying a
+        # TCP handshake each time. Created first, since IP detection
+        # below already uses it.
+        self.http = requests.Session()
+        adapter = HTTPAdapter(pool_connections=32, pool_maxsize=64, max_retries=0)
+        self.http.mount('http://', adapter)
+        self.http.mount('https://', adapter)
+        self.http.headers.update({'Connection': 'keep-alive'})
+        
         # Store the binding host separately from the identity host
         self.binding_host = host
         self.external_ip = external_ip
+        # Needed before IP detection below, which caches next to the config
+        self.config_file = config_file
         
         # If binding to 0.0.0.0 but no external IP provided, try to detect it
         if host == '0.0.0.0' and not external_ip:
@@ -52,22 +94,108 @@ class Node:
         
         self.host = self._normalize_host(host)
         self.port = port
+        # "host:port" key for this node, precomputed once: the hot paths
+        # compare against it constantly and the f-string per comparison
+        # adds up across sweeps and fan-outs
+        self._self_key = f"{self.host}:{self.port}"
         self.node_address = str(uuid.uuid4()).replace('-', '')
         self.blockchain = blockchain or Blockchain()
-        self.config_file = config_file
         self.registered_nodes = self._load_registered_nodes()
+        # "host:port" -> node dict: duplicate checks on registration and
+        # announcements are one hash lookup instead of a list scan, and
+        # the key matches self.active_nodes so joins between the two need
+        # no per-iteration string formatting. self.registered_nodes stays
+        # the ordered view that gets persisted.
+        self.registered_nodes_by_key = {
+            f"{n.get('host')}:{n.get('port')}": n for n in self.registered_nodes}
+        # Config changes are coalesced: mutations set a dirty flag and a
+        # background thread flushes to disk at most once per interval,
+        # so a burst of announcements costs one write instead of N.
+        self._config_dirty = False
+        self._config_lock = threading.Lock()
+        self._config_flush_interval = 5.0
+        flusher = threading.Thread(target=self._flush_config_periodically, daemon=True)
+        flusher.start()
         self.miner_mode = miner_mode
         self.mining_interval = mining_interval
         self.mining_thread = None
         self.mining_address = f"miner-{self.node_address}"  # Address to receive mining rewards
         self.running = False
-        
-        # Track active nodes by their last announcement time
+        # Event instead of a bare flag: the mining loop blocks on it, so
+        # stop_mining interrupts a sleep immediately rather than waiting
+        # out the remainder of the interval.
+        self._stop_event = threading.Event()
+        
+        # Track active nodes by their last announcement time. The dict is
+        # copy-on-write: writers build a replacement under _active_lock
+        # and swap the reference, so readers can iterate a snapshot they
+        # grabbed without locking (and without "dict changed size during
+        # iteration" once pool workers write concurrently).
         self.active_nodes = {}  # Dictionary to store active node status: {node_id: last_announcement_time}
+        self._active_lock = threading.Lock()
         self.activity_timeout = 300  # Consider a node inactive if we haven't heard from it in 5 minutes
+        self._last_evict = 0.0  # last time stale activity entries were dropped
+
+        # Negative cache for unreachable peers: "host:port" -> time before
+        # which we won't probe it again. Each consecutive failure doubles
+        # the backoff so a dead peer costs one timeout per backoff window
+        # instead of one per status sweep.
+        self._dead_peers: Dict[str, float] = {}
+        self._peer_backoff: Dict[str, float] = {}
+        self._peer_backoff_base = 5.0
+        self._peer_backoff_max = 300.0
+        # EWMA of each peer's observed response time. Probes to peers we
+        # know answer in milliseconds shouldn't be allowed to hang for
+        # the full fixed timeout when the peer goes bad.
+        self._peer_rtt_ewma: Dict[str, float] = {}
+
+        # (timestamp, nodes) result of the last forced active-node sweep.
+        # Broadcast + consensus in the same instant would otherwise probe
+        # the whole peer list twice back to back.
+        self._active_nodes_cache: Optional[Tuple[float, List[Dict[str, Any]]]] = None
+
+        # Gossip version counter: bumped whenever the activity table
+        # changes, with the version each key last changed at. Peers
+        # announce the last version they saw from us and get back only
+        # the records that changed since (see /nodes/sync).
+        self._active_version = 0
+        self._active_changed_at: Dict[str, int] = {}
+        # Last version we have seen from each peer, sent as since_version
+        self._peer_sync_version: Dict[str, int] = {}
+
+        # Denormalized count of recently active peers (excluding self):
+        # /nodes/info reads this instead of firing a network sweep.
+        # Refreshed on announcements and lazily when it goes stale.
+        self._active_count = 0
+        self._active_count_ts = 0.0
+
+        # Snapshot of get_active_nodes_info with a short TTL: every
+        # announce round rebuilds the same list, and bursts of peer
+        # announcements within a couple of seconds can reuse it.
+        self._active_info_cache: Tuple[float, List[Dict[str, Any]]] = (0.0, [])
+
+        # Outgoing transaction batch: broadcasts are queued for 50ms and
+        # flushed as one POST per peer, so a burst of transactions costs
+        # one request per peer instead of one per transaction per peer.
+        self._tx_out_queue: List[Transaction] = []
+        self._tx_batch_lock = threading.Lock()
+        self._tx_batch_timer: Optional[threading.Timer] = None
+        
+        # Broadcast fan-out pool: peers are independent, so POSTs run
+        # concurrently and one slow peer no longer stalls the rest. The
+        # pool lives for the node's lifetime since broadcasts happen
+        # outside mining too.
+        self._broadcast_pool = ThreadPoolExecutor(max_workers=32)
         
         # Identity string for this node (used in logs and communication)
-        self.node_identity = f"{self.host}:{self.port}"
+        self.node_identity = self._self_key
+        # Broadcast headers never change after startup, so build them once
+        # instead of per broadcast call
+        self._broadcast_headers = {
+            'Content-Type': 'application/json',
+            'X-Source-Type': 'node_broadcast',
+            'X-Source-Node': self.node_identity
+        }
         logger.info(f"Initialized node with identity: {self.node_identity}")
         if self.external_ip:
             logger.info(f"Node will identify using external IP: {self.external_ip}")
@@ -76,7 +204,26 @@ class Node:
         pass
         
     def _detect_external_ip(self) -> str:
-        """Attempt to detect the external IP address of this node."""
+        """Attempt to detect the external IP address of this node.
+
+        The result is cached on disk for a day: the external IP rarely
+        changes, and the detection services add seconds to every start.
+        Set EXTERNAL_IP in the environment to skip detection entirely.
+        """
+        env_ip = os.environ.get('EXTERNAL_IP')
+        if env_ip:
+            return env_ip.strip()
+
+        cache_path = os.path.join(os.path.dirname(self.config_file) or '.', '.external_ip_cache')
+        try:
+            if time.time() - os.path.getmtime(cache_path) < 86400:
+                with open(cache_path) as f:
+                    cached_ip = f.read().strip()
+                if cached_ip:
+                    return cached_ip
+        except OSError:
+            pass  # no cache yet, or unreadable; fall through to detection
+
         # Try several services to detect external IP
         ip_services = [
             "https://api.ipify.org",
@@ -86,10 +233,11 @@ class Node:
         
         for service in ip_services:
             try:
-                response = requests.get(service, timeout=3)
+                response = self.http.get(service, timeout=2)
                 if response.status_code == 200:
                     ip = response.text.strip()
                     if ip and len(ip) < 45:  # Basic validation to ensure it looks like an IP
+                        self._cache_external_ip(cache_path, ip)
                         return ip
             except Exception as e:
                 logger.debug(f"Failed to get IP from {service}: {e}")
@@ -105,11 +253,21 @@ class Node:
             # Filter out loopback addresses
             external_ips = [ip for ip in ip_list if not ip.startswith('127.')]
             if external_ips:
+                self._cache_external_ip(cache_path, external_ips[0])
                 return external_ips[0]
         except Exception as e:
             logger.debug(f"Failed to get local IP: {e}")
             
         raise Exception("Could not detect external IP address")
+
+    @staticmethod
+    def _cache_external_ip(cache_path: str, ip: str) -> None:
+        """Best-effort write of the detected IP; failure only costs a re-probe."""
+        try:
+            with open(cache_path, 'w') as f:
+                f.write(ip)
+        except OSError as e:
+            logger.debug(f"Could not write external IP cache: {e}")
     
     def _normalize_host(self, host: str) -> str:
         """Normalize host addresses for consistent identification."""
@@ -137,24 +295,49 @@ class Node:
                     {"host": "localhost", "port": 5000, "name": "Primary Node", "node_type": node_type}
                 ]
             }
-            with open(self.config_file, 'w') as f:
-                json.dump(default_config, f, indent=4)
+            with open(self.config_file, 'wb') as f:
+                f.write(orjson.dumps(default_config, option=orjson.OPT_INDENT_2))
                 
         try:
-            with open(self.config_file, 'r') as f:
-                config = json.load(f)
+            with open(self.config_file, 'rb') as f:
+                config = orjson.loads(f.read())
                 logger.info(f"Loaded {len(config.get('nodes', []))} registered nodes from config")
                 return config.get('nodes', [])
-        except (json.JSONDecodeError, KeyError) as e:
+        except (ValueError, KeyError) as e:
             logger.error(f"Error loading config file: {e}")
             return []
             
+    def _mark_config_dirty(self) -> None:
+        """Queue a config save for the background flusher."""
+        with self._config_lock:
+            self._config_dirty = True
+
+    def _flush_config_if_dirty(self) -> None:
+        """Write the config now if there are unsaved changes."""
+        with self._config_lock:
+            if not self._config_dirty:
+                return
+            self._config_dirty = False
+            self._save_registered_nodes()
+
+    def _flush_config_periodically(self) -> None:
+        while True:
+            time.sleep(self._config_flush_interval)
+            self._flush_config_if_dirty()
+
     def _save_registered_nodes(self) -> bool:
         """Save registered nodes to configuration file."""
         try:
             config = {"nodes": self.registered_nodes}
-            with open(self.config_file, 'w') as f:
-                json.dump(config, f, indent=4)
+            # Write to a sibling temp file and rename over the config so a
+            # crash mid-write can never leave a truncated/corrupt file;
+            # os.replace is atomic on the same filesystem.
+            tmp = self.config_file + '.tmp'
+            with open(tmp, 'wb') as f:
+                f.write(orjson.dumps(config, option=orjson.OPT_INDENT_2))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp, self.config_file)
             logger.info(f"Saved {len(self.registered_nodes)} nodes to config")
             return True
         except Exception as e:
@@ -163,9 +346,8 @@ class Node:
         
     def _normalize_node_url(self, node_url: str) -> str:
         """Normalize node URLs for consistent identification."""
-        parsed_url = urlparse(node_url)
-        host = self._normalize_host(parsed_url.netloc.split(':')[0])
-        port = parsed_url.netloc.split(':')[1] if ':' in parsed_url.netloc else '80'
+        raw_host, port = _split_url(node_url)
+        host = self._normalize_host(raw_host or '')
         return f"http://{host}:{port}"
         
     def register_node(self, node_url: str) -> bool:
@@ -178,24 +360,21 @@ class Node:
         Returns:
             bool: True if registration was successful
         """
-        parsed_url = urlparse(node_url)
-        host = self._normalize_host(parsed_url.netloc.split(':')[0])
-        try:
-            port = int(parsed_url.netloc.split(':')[1] if ':' in parsed_url.netloc else '80')
-        except ValueError:
-            logger.error(f"Invalid port in URL: {node_url}")
+        raw_host, port_str = _split_url(node_url)
+        if raw_host is None:
+            logger.error(f"Invalid node URL: {node_url}")
             return False
+        host = self._normalize_host(raw_host)
+        port = int(port_str)
+        node_key = f"{host}:{port}"
             
         # Don't register self
-        if host == self.host and port == self.port:
+        if node_key == self._self_key:
             logger.warning("Cannot register self as peer")
             return False
-            
-        # Check if node is already registered
-        for node in self.registered_nodes:
-            if node.get('host') == host and node.get('port') == port:
-                logger.info(f"Node {host}:{port} already registered")
-                return True
+        if node_key in self.registered_nodes_by_key:
+            logger.info(f"Node {host}:{port} already registered")
+            return True
                 
         # Add new node to configuration
         new_node = {
@@ -205,14 +384,10 @@ class Node:
             "node_type": "unknown"  # We don't know its type yet
         }
         self.registered_nodes.append(new_node)
-        success = self._save_registered_nodes()
-        
-        if success:
-            logger.info(f"Registered new node: {host}:{port}")
-        else:
-            logger.error(f"Failed to save registration for node: {host}:{port}")
-            
-        return success
+        self.registered_nodes_by_key[node_key] = new_node
+        self._mark_config_dirty()
+        logger.info(f"Registered new node: {host}:{port}")
+        return True
         
     def register_with_node(self, node_url: str) -> bool:
         """
@@ -224,16 +399,15 @@ class Node:
         Returns:
             bool: True if registration was successful
         """
-        parsed_url = urlparse(node_url)
-        host = self._normalize_host(parsed_url.netloc.split(':')[0])
-        try:
-            port = int(parsed_url.netloc.split(':')[1] if ':' in parsed_url.netloc else '80')
-        except ValueError:
-            logger.error(f"Invalid port in URL: {node_url}")
+        raw_host, port_str = _split_url(node_url)
+        if raw_host is None:
+            logger.error(f"Invalid node URL: {node_url}")
             return False
+        host = self._normalize_host(raw_host)
+        port = int(port_str)
             
         # Don't register with self
-        if host == self.host and port == self.port:
+        if f"{host}:{port}" == self._self_key:
             logger.warning("Cannot register with self")
             return False
             
@@ -246,9 +420,10 @@ class Node:
             target_url = f"http://{host}:{port}"
             
             # Register with the other node
-            response = requests.post(
+            response = self.http.post(
                 f"{target_url}/nodes/register",
-                json={"nodes": [self.node_address]}
+                data=orjson.dumps({"nodes": [self.node_address]}),
+                headers={'Content-Type': 'application/json'}
             )
             
             if response.status_code == 201:
@@ -256,7 +431,7 @@ class Node:
                 self.register_node(target_url)
                 
                 # Get all nodes from the other node
-                response = requests.get(f"{target_url}/nodes/peers")
+                response = self.http.get(f"{target_url}/nodes/peers")
                 if response.status_code == 200:
                     all_nodes = response.json().get('nodes', [])
                     
@@ -279,48 +454,52 @@ class Node:
         
     def broadcast_transaction(self, transaction: Transaction) -> None:
         """
-        Broadcast a transaction to all active peer nodes.
-        
+        Queue a transaction for broadcast to all active peer nodes.
+
+        Transactions are coalesced for 50ms and sent as a single batch
+        POST per peer (see _flush_tx_batch).
+
         Args:
             transaction: The transaction to broadcast
         """
-        transaction_data = transaction.to_dict()
-        
+        with self._tx_batch_lock:
+            self._tx_out_queue.append(transaction)
+            if self._tx_batch_timer is None:
+                self._tx_batch_timer = threading.Timer(0.05, self._flush_tx_batch)
+                self._tx_batch_timer.daemon = True
+                self._tx_batch_timer.start()
+
+    def _flush_tx_batch(self) -> None:
+        """Send all queued transactions to every active peer in one POST each."""
+        with self._tx_batch_lock:
+            batch = self._tx_out_queue
+            self._tx_out_queue = []
+            self._tx_batch_timer = None
+        if not batch:
+            return
+
+        # Serialize the whole batch once, outside the per-peer loop
+        batch_data = [tx.to_dict() for tx in batch]
+        payload = orjson.dumps(batch_data)
+        packed = _MSGPACK_ENCODE(batch_data) if _MSGPACK_ENCODE is not None else None
+
         # Get all active peer nodes with a forced status check to ensure we have current data
         active_nodes = self.get_active_nodes(exclude_self=True, force_check=True)
-        
+
         if not active_nodes:
-            logger.warning("No active peer nodes found to broadcast transaction to")
+            logger.warning("No active peer nodes found to broadcast transactions to")
             return
-            
-        # Create headers that identify this as a node broadcast to prevent loops
-        headers = {
-            'Content-Type': 'application/json',
-            'X-Source-Type': 'node_broadcast',
-            'X-Source-Node': f"{self.host}:{self.port}"
-        }
-        
-        logger.info(f"Broadcasting transaction from {transaction.sender} to {len(active_nodes)} peer nodes")
-        
-        successful_broadcasts = 0
-        for node in active_nodes:
-            node_url = node['url']
-            try:
-                response = requests.post(
-                    f"{node_url}/transactions/new",
-                    json=transaction_data,
-                    headers=headers,
-                    timeout=5.0  # Add timeout to prevent hanging
-                )
-                if response.status_code == 201:
-                    successful_broadcasts += 1
-                    logger.info(f"Successfully broadcast transaction to {node['name']} at {node_url}")
-                else:
-                    logger.warning(f"Failed to broadcast transaction to {node_url}, status code: {response.status_code}")
-            except requests.exceptions.RequestException as e:
-                logger.error(f"Network error broadcasting transaction to {node_url}: {e}")
-                
-        logger.info(f"Transaction broadcast complete: {successful_broadcasts} of {len(active_nodes)} peers received the transaction")
+
+        # Headers identifying this as a node broadcast (prevents loops);
+        # precomputed in __init__
+        headers = self._broadcast_headers
+
+        logger.info(f"Broadcasting batch of {len(batch)} transactions to {len(active_nodes)} peer nodes")
+
+        successful_broadcasts = self._fan_out(
+            '/transactions/batch', packed, payload, headers, active_nodes, 'transaction batch')
+
+        logger.info(f"Transaction broadcast complete: {successful_broadcasts} of {len(active_nodes)} peers received the batch")
                 
     def broadcast_block(self, block: Block) -> None:
         """
@@ -329,7 +508,10 @@ class Node:
         Args:
             block: The block to broadcast
         """
+        # Cached on the block: a re-broadcast never re-serializes
         block_data = block.to_dict()
+        payload = block.to_json_bytes()
+        packed = _MSGPACK_ENCODE(block_data) if _MSGPACK_ENCODE is not None else None
         
         # Force check active nodes to ensure we have current data
         active_nodes = self.get_active_nodes(exclude_self=True, force_check=True)
@@ -338,35 +520,65 @@ class Node:
             logger.warning("No active peer nodes found to broadcast block to")
             return
             
-        # Create headers that identify this as a node broadcast
-        headers = {
-            'Content-Type': 'application/json',
-            'X-Source-Type': 'node_broadcast',
-            'X-Source-Node': f"{self.host}:{self.port}"
-        }
+        # Headers identifying this as a node broadcast; precomputed in __init__
+        headers = self._broadcast_headers
         
         logger.info(f"Broadcasting block #{block.index} to {len(active_nodes)} peer nodes")
         
-        successful_broadcasts = 0
-        for node in active_nodes:
-            node_url = node['url']
-            try:
-                response = requests.post(
-                    f"{node_url}/blocks/new",
-                    json=block_data,
-                    headers=headers,
-                    timeout=5.0  # Add timeout to prevent hanging
-                )
-                if response.status_code == 201:
-                    successful_broadcasts += 1
-                    logger.info(f"Successfully broadcast block to {node['name']} at {node_url}")
-                else:
-                    logger.warning(f"Failed to broadcast block to {node_url}, status code: {response.status_code}")
-            except requests.exceptions.RequestException as e:
-                logger.error(f"Network error broadcasting block to {node_url}: {e}")
+        successful_broadcasts = self._fan_out(
+            '/blocks/new', packed, payload, headers, active_nodes, 'block')
                 
         logger.info(f"Block broadcast complete: {successful_broadcasts} of {len(active_nodes)} peers received the block")
                 
+    def _fan_out(self, path: str, packed: Optional[bytes], payload: bytes,
+                 headers: Dict[str, str], active_nodes: List[Dict[str, Any]],
+                 label: str) -> int:
+        """POST a pre-encoded payload to every active peer concurrently.
+
+        Total wall time is the slowest peer's round trip instead of the
+        sum of them; stragglers past the collection timeout are logged
+        and abandoned rather than stalling the caller.
+
+        Returns:
+            int: Number of peers that answered 201
+        """
+        futures = {
+            self._broadcast_pool.submit(
+                self._post_with_fallback, f"{node['url']}{path}", packed, payload, headers): node
+            for node in active_nodes
+        }
+        successful = 0
+        try:
+            for future in as_completed(futures, timeout=6.0):
+                node = futures[future]
+                node_url = node['url']
+                try:
+                    response = future.result()
+                except requests.exceptions.RequestException as e:
+                    logger.error(f"Network error broadcasting {label} to {node_url}: {e}")
+                    continue
+                if response.status_code == 201:
+                    successful += 1
+                    logger.info(f"Successfully broadcast {label} to {node['name']} at {node_url}")
+                else:
+                    logger.warning(f"Failed to broadcast {label} to {node_url}, status code: {response.status_code}")
+        except TimeoutError:
+            logger.warning(f"Broadcast of {label} timed out waiting for slow peers")
+        return successful
+
+    def _post_with_fallback(self, url: str, packed: Optional[bytes], json_payload: bytes,
+                            json_headers: Dict[str, str], timeout: float = 5.0):
+        """POST msgpack when available, retrying as JSON if the peer
+        answers 415 (doesn't speak msgpack)."""
+        if packed is not None:
+            msgpack_headers = dict(json_headers, **{'Content-Type': 'application/msgpack'})
+            response = self.http.post(url, data=packed, headers=msgpack_headers,
+                                      timeout=timeout)
+            if response.status_code != 415:
+                return response
+        return self.http.post(url, data=json_payload, headers=json_headers,
+                              timeout=timeout)
+
     def consensus(self) -> bool:
         """
         Implement the consensus algorithm.
@@ -379,29 +591,38 @@ class Node:
         new_chain = None
         replaced = False
         active_nodes = self.get_active_nodes(exclude_self=True)
-        
+
         logger.info(f"Running consensus with {len(active_nodes)} active peers")
-        
-        # Get chains from all active peers
-        for node in active_nodes:
-            node_url = node['url']
+
+        # Phase 1: ask every peer for its chain length in parallel. This
+        # avoids pulling full chain bodies from peers we would discard.
+        def _peer_length(node: Dict) -> int:
             try:
-                response = requests.get(f"{node_url}/chain")
-                
+                response = self.http.get(f"{node['url']}/chain/length", timeout=2)
                 if response.status_code == 200:
-                    chain_data = response.json()
-                    chain = chain_data.get('chain')
-                    length = chain_data.get('length')
-                    
-                    # Check if chain is longer and valid
-                    if length > max_length:
-                        max_length = length
-                        new_chain = chain
-                        logger.info(f"Found longer chain ({length} blocks) from {node['name']}")
-                        
+                    return response.json().get('length', 0)
             except requests.exceptions.RequestException as e:
-                logger.error(f"Failed to get chain from {node_url}: {e}")
-                
+                logger.error(f"Failed to get chain length from {node['url']}: {e}")
+            return 0
+
+        lengths = list(self._broadcast_pool.map(_peer_length, active_nodes)) if active_nodes else []
+
+        # Phase 2: fetch the full chain only from the single longest peer.
+        best_node = None
+        for node, length in zip(active_nodes, lengths):
+            if length > max_length:
+                max_length = length
+                best_node = node
+
+        if best_node:
+            try:
+                response = self.http.get(f"{best_node['url']}/chain")
+                if response.status_code == 200:
+                    new_chain = response.json().get('chain')
+                    logger.info(f"Found longer chain ({max_length} blocks) from {best_node['name']}")
+            except requests.exceptions.RequestException as e:
+                logger.error(f"Failed to get chain from {best_node['url']}: {e}")
+
         # Replace our chain if we found a longer valid one
         if new_chain:
             replaced = self.blockchain.replace_chain(new_chain)
@@ -430,6 +651,7 @@ class Node:
             return
             
         self.running = True
+        self._stop_event.clear()
         self.mining_thread = threading.Thread(target=self._mine_continuously)
         self.mining_thread.daemon = True
         self.mining_thread.start()
@@ -438,30 +660,34 @@ class Node:
     def stop_mining(self) -> None:
         """Stop the mining process."""
         self.running = False
+        self._stop_event.set()  # wakes the loop out of its interval wait
         if self.mining_thread:
             self.mining_thread.join(timeout=1)
+        # Make sure queued config changes hit disk
+        self._flush_config_if_dirty()
         logger.info("Stopped mining")
         
     def _mine_continuously(self) -> None:
         """Mine blocks continuously but only when we have exactly 3 non-system transactions."""
-        while self.running:
-            # Count only non-system transactions
-            non_system_txs = [tx for tx in self.blockchain.pending_transactions if tx.sender != "0"]
-            
+        while not self._stop_event.is_set():
+            # The blockchain maintains this count incrementally, so the
+            # poll loop never rescans the pending pool
+            non_system_count = self.blockchain._nonsystem_pending_count
+
             # Only mine if there are exactly 3 pending non-system transactions
-            if len(non_system_txs) == 3:
+            if non_system_count == 3:
                 logger.info("Mining new block with 3 transactions...")
                 block = self.blockchain.mine_pending_transactions(self.mining_address)
                 self.broadcast_block(block)
                 logger.info(f"Mined new block with index {block.index} containing 3 transactions")
-            elif len(non_system_txs) > 0:
+            elif non_system_count > 0:
                 # We have transactions but not enough to mine
-                logger.info(f"Waiting for more transactions... Currently have {len(non_system_txs)}/3")
+                logger.info(f"Waiting for more transactions... Currently have {non_system_count}/3")
             else:
                 logger.info("No pending transactions to mine")
                 
-            # Wait for the specified interval
-            time.sleep(self.mining_interval)
+            # Wait for the interval, returning early if stop is requested
+            self._stop_event.wait(self.mining_interval)
             
     def handle_new_transaction(self, transaction_data: Dict[str, Any]) -> bool:
         """
@@ -490,22 +716,21 @@ class Node:
             
             # If transaction was added, check if we should mine
             if result and self.miner_mode and not self.mining_thread:
-                # Count only non-system transactions (sender != "0")
-                non_system_txs = [tx for tx in self.blockchain.pending_transactions if tx.sender != "0"]
-                
+                # O(1) counter maintained by the blockchain (sender != "0")
+                non_system_count = self.blockchain._nonsystem_pending_count
+
                 # Mine automatically when we have exactly 3 pending transactions
-                if len(non_system_txs) == 3:
+                if non_system_count == 3:
                     logger.info("Detected exactly 3 pending transactions - mining a new block")
                     # Mine immediately instead of starting the mining thread
                     new_block = self.blockchain.mine_pending_transactions(self.mining_address)
                     self.broadcast_block(new_block)
                     logger.info(f"Automatically mined block with index {new_block.index} containing 3 transactions")
-                elif len(non_system_txs) > 3:
-                    logger.warning(f"Have {len(non_system_txs)} pending transactions, more than the 3 transaction limit")
+                elif non_system_count > 3:
+                    logger.warning(f"Have {non_system_count} pending transactions, more than the 3 transaction limit")
             elif not self.miner_mode:
                 # Check if we have 3 transactions anyway so we can log a message
-                non_system_txs = [tx for tx in self.blockchain.pending_transactions if tx.sender != "0"]
-                if len(non_system_txs) == 3:
+                if self.blockchain._nonsystem_pending_count == 3:
                     logger.warning("Have 3 pending transactions but this is not a miner node")
                     
             return result
@@ -513,6 +738,22 @@ class Node:
         except Exception as e:
             logger.error(f"Failed to process transaction: {e}")
             return False
+
+    def handle_new_transactions(self, transactions_data: List[Dict[str, Any]]) -> int:
+        """
+        Handle a batch of transactions received from a peer broadcast.
+
+        Args:
+            transactions_data: List of transaction dictionaries
+
+        Returns:
+            int: Number of transactions accepted into the pending pool
+        """
+        accepted = 0
+        for transaction_data in transactions_data:
+            if self.handle_new_transaction(transaction_data):
+                accepted += 1
+        return accepted
             
     def handle_new_block(self, block_data: Dict[str, Any]) -> bool:
         """
@@ -566,38 +807,39 @@ class Node:
         Args:
             block: The block containing transactions to remove
         """
-        # Log pending transactions before removal for debugging
-        logger.info(f"Before removal: {len(self.blockchain.pending_transactions)} pending transactions")
-        if self.blockchain.pending_transactions:
+        # Per-transaction traces are debug-only and gated so the f-strings
+        # are never even built at the default INFO level
+        per_tx_debug = logger.isEnabledFor(logging.DEBUG)
+        if per_tx_debug:
+            logger.debug(f"Before removal: {len(self.blockchain.pending_transactions)} pending transactions")
             for i, tx in enumerate(self.blockchain.pending_transactions):
-                logger.info(f"  Pending tx #{i+1}: {tx.sender} -> {tx.recipient} ({tx.amount})")
+                logger.debug(f"  Pending tx #{i+1}: {tx.sender} -> {tx.recipient} ({tx.amount})")
         
-        # Get transaction hashes from the block
-        block_tx_hashes = {tx.calculate_hash() for tx in block.transactions}
+        # Identifier set is all the filter needs: any transaction the old
+        # hash check would have matched has identical fields and therefore
+        # an identical (sender, recipient, amount) identifier, while the
+        # identifier also catches different-timestamp copies.
+        block_tx_identifiers = frozenset((tx.sender, tx.recipient, tx.amount) for tx in block.transactions)
         
-        # Get transaction identifiers for more thorough matching
-        block_tx_identifiers = {(tx.sender, tx.recipient, tx.amount) for tx in block.transactions}
-        
-        # Log transactions in the block
-        logger.info(f"Block #{block.index} contains {len(block.transactions)} transactions:")
-        for i, tx in enumerate(block.transactions):
-            logger.info(f"  Block tx #{i+1}: {tx.sender} -> {tx.recipient} ({tx.amount})")
+        # Per-transaction block contents, debug-only
+        if per_tx_debug:
+            logger.debug(f"Block #{block.index} contains {len(block.transactions)} transactions:")
+            for i, tx in enumerate(block.transactions):
+                logger.debug(f"  Block tx #{i+1}: {tx.sender} -> {tx.recipient} ({tx.amount})")
         
         # Get count before removal
         count_before = len(self.blockchain.pending_transactions)
         
-        # First pass: Remove transactions with matching hashes
-        transactions_after_hash_check = [
+        # Single pass over the pending pool with one set lookup per
+        # transaction; no hashing at all on this path
+        self.blockchain.pending_transactions = deque(
             tx for tx in self.blockchain.pending_transactions
-            if tx.calculate_hash() not in block_tx_hashes
-        ]
-        
-        # Second pass: Remove transactions with matching sender/recipient/amount
-        # This is more aggressive and catches transactions that might have different timestamps
-        self.blockchain.pending_transactions = [
-            tx for tx in transactions_after_hash_check
             if (tx.sender, tx.recipient, tx.amount) not in block_tx_identifiers
-        ]
+        )
+        # Keep the duplicate-detection indices and pending overlay in
+        # step with the pool we just replaced
+        self.blockchain._rebuild_tx_indices()
+        self.blockchain._rebuild_pending_deltas()
         
         # Get count after removal
         count_after = len(self.blockchain.pending_transactions)
@@ -609,11 +851,11 @@ class Node:
         else:
             logger.warning(f"WARNING: No pending transactions were removed for block {block.index}. This may indicate a synchronization issue.")
         
-        # Log remaining transactions if any
-        if self.blockchain.pending_transactions:
-            logger.info(f"After removal: {len(self.blockchain.pending_transactions)} pending transactions remain:")
+        # Remaining transactions, debug-only
+        if per_tx_debug and self.blockchain.pending_transactions:
+            logger.debug(f"After removal: {len(self.blockchain.pending_transactions)} pending transactions remain:")
             for i, tx in enumerate(self.blockchain.pending_transactions):
-                logger.info(f"  Remaining tx #{i+1}: {tx.sender} -> {tx.recipient} ({tx.amount})")
+                logger.debug(f"  Remaining tx #{i+1}: {tx.sender} -> {tx.recipient} ({tx.amount})")
         else:
             logger.info("No pending transactions remain after block processing")
         
@@ -634,19 +876,24 @@ class Node:
             node_key = f"{host}:{port}"
             
             # Update the active nodes dictionary with current timestamp
-            self.active_nodes[node_key] = time.time()
+            self._set_active(node_key, time.time())
+            self._active_version += 1
+            self._active_changed_at[node_key] = self._active_version
+            # New announcement: the cached active-node snapshot is stale
+            self._active_info_cache = (0.0, [])
+            self._refresh_active_count()
             
             # Check if this node is already in our registered nodes
-            for node in self.registered_nodes:
-                if node.get('host') == host and node.get('port') == port:
-                    # Update existing node's info
-                    node['node_type'] = node_type
-                    if name:
-                        node['name'] = name
-                    # Save the updated configuration
-                    self._save_registered_nodes()
-                    logger.info(f"Updated node {host}:{port} status to active")
-                    return True
+            node = self.registered_nodes_by_key.get(node_key)
+            if node is not None:
+                # Update existing node's info
+                node['node_type'] = node_type
+                if name:
+                    node['name'] = name
+                # Queue the updated configuration for the flusher
+                self._mark_config_dirty()
+                logger.info(f"Updated node {host}:{port} status to active")
+                return True
             
             # Node not found in registered nodes, add it
             new_node = {
@@ -656,7 +903,8 @@ class Node:
                 "node_type": node_type
             }
             self.registered_nodes.append(new_node)
-            self._save_registered_nodes()
+            self.registered_nodes_by_key[node_key] = new_node
+            self._mark_config_dirty()
             logger.info(f"Added new active node {host}:{port}")
             return True
             
@@ -664,6 +912,114 @@ class Node:
             logger.error(f"Error recording active node {host}:{port}: {e}")
             return False
     
+    def get_activity_delta(self, since_version: int) -> Tuple[int, Dict[str, Dict[str, Any]]]:
+        """Activity records that changed after since_version.
+
+        Returns (current_version, {key: record}) where each record
+        carries the node's metadata and last announcement timestamp, so
+        a peer can merge it with one dict update instead of re-receiving
+        the whole table on every exchange.
+        """
+        cutoff = time.time() - self.activity_timeout
+        delta: Dict[str, Dict[str, Any]] = {}
+        for node_key, changed_at in self._active_changed_at.items():
+            if changed_at <= since_version:
+                continue
+            timestamp = self.active_nodes.get(node_key)
+            if timestamp is None or timestamp <= cutoff:
+                continue
+            node = self.registered_nodes_by_key.get(node_key)
+            if node is not None:
+                host, port = node.get('host'), node.get('port')
+                node_type = node.get('node_type', 'full')
+                name = node.get('name')
+            else:
+                host, _, port_str = node_key.rpartition(':')
+                port = int(port_str)
+                node_type = 'full'
+                name = None
+            delta[node_key] = {
+                'host': host,
+                'port': port,
+                'node_type': node_type,
+                'name': name,
+                'timestamp': timestamp,
+            }
+        return self._active_version, delta
+
+    def _apply_activity_delta(self, delta: Dict[str, Dict[str, Any]]) -> None:
+        """Merge a peer's activity delta, keeping the newest timestamp per key."""
+        updates = {}
+        for node_key, record in delta.items():
+            timestamp = record.get('timestamp')
+            if not isinstance(timestamp, (int, float)):
+                continue
+            if timestamp <= self.active_nodes.get(node_key, 0.0):
+                continue
+            updates[node_key] = timestamp
+            # Register nodes we've never seen so the metadata isn't lost
+            if node_key not in self.registered_nodes_by_key and 'host' in record and 'port' in record:
+                new_node = {
+                    'host': record['host'],
+                    'port': record['port'],
+                    'name': record.get('name') or f"Node {node_key}",
+                    'node_type': record.get('node_type', 'full'),
+                }
+                self.registered_nodes.append(new_node)
+                self.registered_nodes_by_key[node_key] = new_node
+                self._mark_config_dirty()
+        if not updates:
+            return
+        # One copy-on-write swap for the whole delta
+        with self._active_lock:
+            new_table = dict(self.active_nodes)
+            new_table.update(updates)
+            self.active_nodes = new_table
+        for node_key in updates:
+            self._active_version += 1
+            self._active_changed_at[node_key] = self._active_version
+        self._active_info_cache = (0.0, [])
+        self._refresh_active_count()
+
+    def _evict_stale_nodes(self, cutoff: float) -> None:
+        """Copy-on-write removal of activity entries older than cutoff."""
+        with self._active_lock:
+            new_table = {k: v for k, v in self.active_nodes.items() if v > cutoff}
+            if len(new_table) == len(self.active_nodes):
+                return
+            self.active_nodes = new_table
+        # Keep the change-version map in step so delta scans don't walk
+        # keys that no longer exist in the table
+        for node_key in list(self._active_changed_at):
+            if node_key not in new_table:
+                del self._active_changed_at[node_key]
+
+    def _set_active(self, node_key: str, timestamp: float) -> None:
+        """Copy-on-write single-entry update of the activity table."""
+        with self._active_lock:
+            new_table = dict(self.active_nodes)
+            new_table[node_key] = timestamp
+            self.active_nodes = new_table
+
+    def _refresh_active_count(self) -> None:
+        """Recount recently active peers (table scan, no network)."""
+        now = time.time()
+        cutoff = now - self.activity_timeout
+        snapshot = self.active_nodes
+        self._active_count = sum(
+            1 for node_key, ts in snapshot.items()
+            if ts > cutoff and node_key != self._self_key)
+        self._active_count_ts = now
+
+    def _is_recently_active(self, node_key: str, now: float) -> bool:
+        """Pure dict-lookup liveness: announced within the activity window.
+
+        The cheap path for informational callers; never touches the
+        network and never formats anything.
+        """
+        last_announcement = self.active_nodes.get(node_key)
+        return last_announcement is not None and (now - last_announcement) < self.activity_timeout
+
     def check_node_status(self, host: str, port: int, timeout: float = 2.0, force_check: bool = False) -> bool:
         """
         Check if a node is active based on its last announcement time.
@@ -682,33 +1038,52 @@ class Node:
         node_key = f"{host}:{port}"
         
         # If this is our own node, always return True
-        if host == self.host and port == self.port:
+        if node_key == self._self_key:
             return True
         
         current_time = time.time()
         
-        # Check if we have an announcement record for this node
-        if node_key in self.active_nodes:
-            last_announcement = self.active_nodes[node_key]
-            
-            # Node is active if we've heard from it within the activity timeout period
-            if (current_time - last_announcement) < self.activity_timeout:
-                return True
+        # Node is active if we've heard from it within the activity timeout period
+        if self._is_recently_active(node_key, current_time):
+            return True
                 
         # No recent announcement record found or node appears inactive
         # If force_check is True, try to ping the node's API
         if force_check:
+            # Skip peers that recently failed and are still in backoff;
+            # probing them again would just burn another full timeout.
+            if self._dead_peers.get(node_key, 0) > current_time:
+                return False
+            # Adapt the timeout to what this peer usually takes: 3x its
+            # smoothed RTT, floored at 200ms and capped at the caller's
+            # timeout. Unknown peers get the full timeout.
+            ewma = self._peer_rtt_ewma.get(node_key)
+            adaptive_timeout = timeout if ewma is None else min(timeout, max(0.2, 3.0 * ewma))
             try:
                 node_url = f"http://{host}:{port}"
-                response = requests.get(f"{node_url}/nodes/info", timeout=timeout)
-                if response.status_code == 200:
+                t0 = time.perf_counter()
+                # HEAD on /ping carries no body and does no work on the
+                # peer; older peers without the route get the legacy probe
+                response = self.http.head(f"{node_url}/ping", timeout=adaptive_timeout)
+                if response.status_code in (404, 405):
+                    response = self.http.get(f"{node_url}/nodes/info", timeout=adaptive_timeout)
+                if 200 <= response.status_code < 300:
+                    elapsed = time.perf_counter() - t0
+                    prev = self._peer_rtt_ewma.get(node_key, elapsed)
+                    self._peer_rtt_ewma[node_key] = 0.2 * elapsed + 0.8 * prev
                     # Node is responsive, update its active status
-                    self.active_nodes[node_key] = current_time
+                    self._set_active(node_key, current_time)
+                    self._dead_peers.pop(node_key, None)
+                    self._peer_backoff.pop(node_key, None)
                     logger.info(f"Node {host}:{port} is active through direct ping")
                     return True
             except requests.exceptions.RequestException:
-                # Failed to connect, node is inactive
-                pass
+                # Failed to connect; remember it with doubled backoff
+                backoff = min(self._peer_backoff.get(node_key, self._peer_backoff_base / 2) * 2,
+                              self._peer_backoff_max)
+                self._peer_backoff[node_key] = backoff
+                self._dead_peers[node_key] = current_time + backoff
+                logger.debug(f"Node {host}:{port} unreachable, backing off {backoff:.0f}s")
                 
         return False
             
@@ -718,26 +1093,48 @@ class Node:
         Returns:
             List of dictionaries containing basic node information for active nodes
         """
-        active_nodes_info = []
         current_time = time.time()
-        
-        for node in self.registered_nodes:
+
+        # Serve the recent snapshot if nothing announced since it was
+        # built; record_active_node resets the timestamp to invalidate.
+        cache_ts, cached_info = self._active_info_cache
+        if current_time - cache_ts < 2.0:
+            return cached_info
+
+        cutoff = current_time - self.activity_timeout
+
+        # Drop entries whose last announcement fell past the cutoff, at
+        # most once per timeout window: the table (and the version map
+        # that mirrors it) stays bounded by the live peer count instead
+        # of growing with every peer ever seen.
+        if current_time - self._last_evict > self.activity_timeout:
+            self._evict_stale_nodes(cutoff)
+            self._last_evict = current_time
+
+        # Gather the announcement timestamps in registration order and
+        # run the cutoff comparison as one vectorized pass; only the
+        # surviving rows are touched by Python-level dict building.
+        keys = list(self.registered_nodes_by_key)
+        active = self.active_nodes
+        timestamps = np.fromiter((active.get(k, 0.0) for k in keys),
+                                 dtype=np.float64, count=len(keys))
+
+        active_nodes_info = []
+        for idx in np.nonzero(timestamps > cutoff)[0]:
+            node = self.registered_nodes_by_key[keys[idx]]
             host = node.get('host')
             port = node.get('port')
-            node_key = f"{host}:{port}"
-            
-            # Check if this node is active based on announcement time
-            if node_key in self.active_nodes:
-                last_announcement = self.active_nodes[node_key]
-                if (current_time - last_announcement) < self.activity_timeout:
-                    # Only include essential information for propagation
-                    active_nodes_info.append({
-                        'host': host,
-                        'port': port,
-                        'node_type': node.get('node_type', 'full'),
-                        'name': node.get('name', f"Node {host}:{port}")
-                    })
-                    
+            # Only include essential information for propagation;
+            # the fallback name is only formatted when there is no
+            # registered name (or-short-circuit)
+            active_nodes_info.append({
+                'host': host,
+                'port': port,
+                'node_type': node.get('node_type', 'full'),
+                'name': node.get('name') or f"Node {host}:{port}"
+            })
+
+        self._active_info_cache = (current_time, active_nodes_info)
         return active_nodes_info
     
     def get_active_nodes(self, exclude_self: bool = False, force_check: bool = True) -> List[Dict[str, Any]]:
@@ -756,45 +1153,75 @@ class Node:
         if not self.registered_nodes:
             logger.warning("No registered nodes found to check for activity")
             return active_nodes
-            
+
+        # A forced sweep probes every peer; results this fresh (sub-second)
+        # can't meaningfully differ, so serve them from the last sweep.
+        if force_check and self._active_nodes_cache is not None:
+            cache_ts, cached = self._active_nodes_cache
+            if time.time() - cache_ts < 1.0:
+                if exclude_self:
+                    return [n for n in cached
+                            if f"{n.get('host')}:{n.get('port')}" != self._self_key]
+                return list(cached)
+
         logger.info(f"Checking status of {len(self.registered_nodes)} registered nodes (force_check={force_check})")
-        
-        for node in self.registered_nodes:
-            host = node.get('host')
-            port = node.get('port')
-            
-            # Skip self if requested
-            if exclude_self and host == self.host and port == self.port:
-                continue
-                
-            # Check node status with optional force check
-            is_active = self.check_node_status(host, port, force_check=force_check)
-            
+
+        nodes = list(self.registered_nodes)
+        statuses = self._check_statuses(nodes, force_check)
+
+        # Probe self too (an O(1) short-circuit) so the cached sweep
+        # is complete regardless of the exclude_self flag
+        for node, is_active in zip(nodes, statuses):
             if is_active:
+                host = node.get('host')
+                port = node.get('port')
                 node_info = node.copy()
                 node_info['active'] = True
                 node_info['url'] = f"http://{host}:{port}"
                 active_nodes.append(node_info)
-                
+
+        if force_check:
+            self._active_nodes_cache = (time.time(), active_nodes)
+
+        if exclude_self:
+            active_nodes = [n for n in active_nodes
+                            if f"{n.get('host')}:{n.get('port')}" != self._self_key]
+
         logger.info(f"Found {len(active_nodes)} active nodes out of {len(self.registered_nodes)} registered nodes")
         return active_nodes
         
+    def _check_statuses(self, nodes: List[Dict[str, Any]], force_check: bool) -> List[bool]:
+        """Check the status of several nodes, in parallel when probing.
+
+        Forced probes block on network timeouts, so they run concurrently
+        on the broadcast pool and the sweep takes one slowest-peer timeout
+        instead of their sum; announcement-only checks take the pure
+        dict-lookup fast path since they never touch the network.
+        """
+        if force_check and len(nodes) > 1:
+            return list(self._broadcast_pool.map(
+                lambda n: self.check_node_status(n.get('host'), n.get('port'),
+                                                 timeout=2.0, force_check=True),
+                nodes))
+        if force_check:
+            return [self.check_node_status(n.get('host'), n.get('port'), force_check=True)
+                    for n in nodes]
+        now = time.time()
+        return [node_key == self._self_key or self._is_recently_active(node_key, now)
+                for node_key in (f"{n.get('host')}:{n.get('port')}" for n in nodes)]
+
     def get_all_nodes(self) -> List[Dict[str, Any]]:
         """Get all registered nodes with their active status."""
+        nodes = list(self.registered_nodes)
+        statuses = self._check_statuses(nodes, force_check=False)
+
         nodes_with_status = []
-        
-        for node in self.registered_nodes:
-            host = node.get('host')
-            port = node.get('port')
-            
-            # Check if node is active
-            is_active = self.check_node_status(host, port)
-            
+        for node, is_active in zip(nodes, statuses):
             node_info = node.copy()
             node_info['active'] = is_active
-            node_info['url'] = f"http://{host}:{port}"
+            node_info['url'] = f"http://{node.get('host')}:{node.get('port')}"
             nodes_with_status.append(node_info)
-            
+
         return nodes_with_status
         
     def get_peers(self) -> List[Dict[str, Any]]:
@@ -807,8 +1234,11 @@ class Node:
         Returns:
             int: Number of successful announcements
         """
-        # Mark ourselves as active
-        self.active_nodes[f"{self.host}:{self.port}"] = time.time()
+        # Mark ourselves as active (and version it so peers pulling a
+        # delta learn we're alive)
+        self._set_active(self._self_key, time.time())
+        self._active_version += 1
+        self._active_changed_at[self._self_key] = self._active_version
         
         # Get our current active nodes to share with peers
         active_nodes_info = self.get_active_nodes_info()
@@ -822,68 +1252,131 @@ class Node:
             'active_nodes': active_nodes_info  # Share our knowledge of active nodes
         }
         
+        # Announce to all registered peers (except self), fanning the
+        # POSTs out on the broadcast pool: the round takes one
+        # slowest-peer timeout instead of their sum. Responses are
+        # processed back on this thread so record_active_node never
+        # runs concurrently with itself.
+        peers = [node for node in self.registered_nodes
+                 if f"{node.get('host')}:{node.get('port')}" != self._self_key]
+
+        if not peers:
+            logger.info("Announced to 0 peers")
+            return 0
+
+        # Encode the announcement exactly once; the per-peer since_version
+        # travels in the query string so the body is identical for all
+        body = orjson.dumps(announcement)
+        results = list(self._broadcast_pool.map(
+            lambda node: self._announce_to_one(node, body), peers))
+
         successful_announcements = 0
-        
-        # Announce to all registered peers (except self)
-        for node in self.registered_nodes:
-            host = node.get('host')
-            port = node.get('port')
-            
-            # Skip announcing to self
-            if host == self.host and port == self.port:
+        # Deltas from all peers are merged here first (newest timestamp
+        # wins per key) and applied in one _apply_activity_delta call:
+        # the whole round costs a single copy-on-write table swap and
+        # one cache invalidation instead of one per responding peer.
+        merged_delta: Dict[str, Dict[str, Any]] = {}
+        for ok, response_data in results:
+            if not ok:
                 continue
-                
-            try:
-                url = f"http://{host}:{port}/nodes/announce"
-                response = requests.post(url, json=announcement, timeout=2.0)
-                
-                if response.status_code == 200:
-                    successful_announcements += 1
-                    logger.info(f"Successfully announced to {host}:{port}")
-                    
-                    # Process the response to learn about the responding node and its active nodes
-                    response_data = response.json()
-                    if 'node' in response_data:
-                        node_info = response_data['node']
-                        
-                        # Record the responding node as active
-                        if all(k in node_info for k in ['host', 'port', 'node_type']):
+            successful_announcements += 1
+            if not response_data:
+                continue
+            # Versioned sync response: fold the delta into the merge and
+            # remember the peer's version for the next exchange
+            if 'delta' in response_data:
+                for node_key, record in (response_data.get('delta') or {}).items():
+                    existing = merged_delta.get(node_key)
+                    if existing is None or record.get('timestamp', 0) > existing.get('timestamp', 0):
+                        merged_delta[node_key] = record
+                node_info = response_data.get('node') or {}
+                if all(k in node_info for k in ['host', 'port', 'node_type']):
+                    self.record_active_node(
+                        node_info['host'],
+                        node_info['port'],
+                        node_info['node_type'],
+                        node_info.get('name')
+                    )
+                    if 'version' in response_data:
+                        peer_key = f"{node_info['host']}:{node_info['port']}"
+                        self._peer_sync_version[peer_key] = response_data['version']
+                continue
+            if 'node' in response_data:
+                node_info = response_data['node']
+
+                # Record the responding node as active
+                if all(k in node_info for k in ['host', 'port', 'node_type']):
+                    self.record_active_node(
+                        node_info['host'],
+                        node_info['port'],
+                        node_info['node_type'],
+                        node_info.get('name')
+                    )
+
+                # Process active nodes from the response
+                if 'active_nodes' in node_info and isinstance(node_info['active_nodes'], list):
+                    for active_node in node_info['active_nodes']:
+                        if all(k in active_node for k in ['host', 'port', 'node_type']):
                             self.record_active_node(
-                                node_info['host'], 
-                                node_info['port'], 
-                                node_info['node_type'],
-                                node_info.get('name')
+                                active_node['host'],
+                                active_node['port'],
+                                active_node['node_type'],
+                                active_node.get('name')
                             )
-                            
-                        # Process active nodes from the response
-                        if 'active_nodes' in node_info and isinstance(node_info['active_nodes'], list):
-                            for active_node in node_info['active_nodes']:
-                                if all(k in active_node for k in ['host', 'port', 'node_type']):
-                                    self.record_active_node(
-                                        active_node['host'],
-                                        active_node['port'],
-                                        active_node['node_type'],
-                                        active_node.get('name')
-                                    )
-                else:
-                    logger.warning(f"Failed to announce to {host}:{port}: HTTP {response.status_code}")
-                    
-            except requests.exceptions.RequestException as e:
-                logger.warning(f"Failed to announce to {host}:{port}: {e}")
-                
+
+        if merged_delta:
+            self._apply_activity_delta(merged_delta)
+
         logger.info(f"Announced to {successful_announcements} peers")
         return successful_announcements
+
+    def _announce_to_one(self, node: Dict[str, Any], body: bytes) -> Tuple[bool, Optional[Dict[str, Any]]]:
+        """POST one pre-encoded announcement; returns (ok, parsed response or None).
+
+        Runs on a pool worker, so it only performs the network call and
+        leaves all shared-state updates to the caller. The body is the
+        orjson-encoded announcement shared by every peer.
+        """
+        host = node.get('host')
+        port = node.get('port')
+        peer_key = f"{host}:{port}"
+        headers = {'Content-Type': 'application/json'}
+        try:
+            # Prefer the batched sync exchange: send only the version we
+            # last saw and get back a delta instead of the full table
+            since_version = self._peer_sync_version.get(peer_key, 0)
+            response = self.http.post(
+                f"http://{peer_key}/nodes/sync?since_version={since_version}",
+                data=body, headers=headers, timeout=2.0)
+            if response.status_code == 404:
+                # Older peer without /nodes/sync: legacy announce
+                response = self.http.post(f"http://{peer_key}/nodes/announce",
+                                          data=body, headers=headers, timeout=2.0)
+            if response.status_code == 200:
+                logger.info(f"Successfully announced to {host}:{port}")
+                return True, orjson.loads(response.content)
+            logger.warning(f"Failed to announce to {host}:{port}: HTTP {response.status_code}")
+        except requests.exceptions.RequestException as e:
+            logger.warning(f"Failed to announce to {host}:{port}: {e}")
+        except ValueError:
+            # Announcement landed but the body wasn't JSON; still a success
+            return True, None
+        return False, None
     
     def get_info(self) -> Dict[str, Any]:
         """Get node information."""
-        active_nodes = self.get_active_nodes(exclude_self=True)
+        # Serve the maintained counter instead of sweeping the network on
+        # every info request; recount only when it has gone stale enough
+        # for entries to have expired out of the window.
+        if time.time() - self._active_count_ts > self.activity_timeout / 2:
+            self._refresh_active_count()
         return {
             'address': self.node_address,
             'host': self.host,
             'port': self.port,
             'node_type': 'miner' if self.miner_mode else 'full',
             'registered_nodes': len(self.registered_nodes),
-            'active_nodes': len(active_nodes),
+            'active_nodes': self._active_count,
             'chain_length': len(self.blockchain.chain),
             'pending_transactions': len(self.blockchain.pending_transactions),
             'is_mining': self.mining_thread is not None and self.mining_thread.is_alive() if self.mining_thread else False,